@@ -12,22 +12,32 @@ Features:
 - Date inference for interaction history
 - Outcome inference from keywords
 - Fuzzy venue matching for shows
+
+Requires migrations 001-005: contact upserts use ON CONFLICT on the unique
+name + city index from migration 005.
 """
 
 import argparse
+import csv
+import io
 import logging
+import logging.handlers
+import re
 import sys
 
 logger = logging.getLogger('import_xlsx')
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Tuple
+from datetime import datetime
+from typing import Iterable, Optional, Dict, List, Tuple
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
+import numpy as np
+import openpyxl
 import pandas as pd
 import psycopg2
-from psycopg2.extras import RealDictCursor
-from rapidfuzz import fuzz
+from psycopg2.extras import RealDictCursor, execute_values
+from rapidfuzz import fuzz, process
 from dotenv import load_dotenv
 import os
 
@@ -41,6 +51,50 @@ load_dotenv(project_root / ".env")
 XLSX_PATH = project_root / "data" / "art-marketing.xlsx"
 NOTES_DIR = project_root / "data" / "notes"
 
+# Columns parsed from each imported sheet (labels keep their spreadsheet positions)
+SHEET_USECOLS = {
+    'contacts  leads': [3, 4, 5, 6, 7, 13, 14, 15, 16, 17, 18, 19, 20],
+    'show dates': [1, 2, 3, 4],
+    'on line': [2, 6, 7, 8, 9],
+}
+
+# Rust-based calamine parser when python-calamine is installed, else openpyxl
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
+
+# Sheets read with openpyxl's streaming row iterator instead of pd.read_excel
+# (only without calamine, which parses the whole sheet faster still)
+STREAMED_SHEETS = {'contacts  leads'} if EXCEL_ENGINE == 'openpyxl' else set()
+
+# Free-form sheets exported to markdown instead of imported
+NOTES_SHEETS = (
+    'plans',
+    'notes  ideas',
+    'gofundme options',
+    'notes - live painting',
+    'helpers',
+    'ideas',
+)
+
+# Contact columns written by the importer, in INSERT/COPY order
+CONTACT_COLUMNS = (
+    'name', 'type', 'subtype', 'city', 'country', 'address', 'website', 'email',
+    'phone', 'preferred_language', 'status', 'notes',
+)
+
+# Interaction columns written by the importer, in INSERT order
+INTERACTION_COLUMNS = (
+    'contact_id', 'interaction_date', 'method', 'direction', 'summary',
+    'outcome', 'next_action', 'next_action_date',
+)
+
+# New contacts are bulk-loaded with COPY from this batch size on;
+# smaller batches use a multi-row INSERT
+COPY_THRESHOLD = 500
+
 
 # =============================================================================
 # OUTCOME KEYWORD MATCHER
@@ -81,6 +135,33 @@ OUTCOME_KEYWORDS = {
     ],
 }
 
+# One alternation per outcome, matched against lowercased text (so the
+# uppercase 'IN' keyword never matches). Dict order is the match priority.
+OUTCOME_PATTERNS = {
+    outcome: re.compile('|'.join(map(re.escape, keywords)))
+    for outcome, keywords in OUTCOME_KEYWORDS.items()
+}
+
+# Contact status implied by the latest interaction outcome
+STATUS_MAP = {
+    'no_reply': 'contacted',
+    'interested': 'meeting',
+    'rejected': 'rejected',
+    'meeting_set': 'meeting',
+    'proposal_requested': 'proposal',
+    'accepted': 'accepted',
+    'not_interested': 'rejected',
+}
+
+# Contact attempt columns in the contacts sheet: (col, label, months_offset)
+ATTEMPT_SPEC = (
+    (3, 'first contact', 0),
+    (4, 'second', 5),
+    (5, 'third', 10),
+    (6, 'forth', 15),
+    (7, 'fifth', 20),
+)
+
 
 def infer_outcome(text: str) -> str:
     """
@@ -92,28 +173,70 @@ def infer_outcome(text: str) -> str:
 
     text_lower = str(text).lower()
 
-    # Check each outcome's keywords
-    for outcome, keywords in OUTCOME_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in text_lower:
-                return outcome
+    # One regex scan per outcome, in priority order
+    for outcome, pattern in OUTCOME_PATTERNS.items():
+        if pattern.search(text_lower):
+            return outcome
 
     # Default: no reply
     return 'no_reply'
 
 
+def infer_outcomes(texts: pd.Series) -> np.ndarray:
+    """
+    Vectorized infer_outcome() over a whole column of attempt cells.
+    Outcomes keep OUTCOME_KEYWORDS priority order; empty cells give 'no_reply'.
+    """
+    lowered = texts.where(texts.notna(), '').astype(str).str.lower()
+    masks = [
+        lowered.str.contains(pattern, regex=True).to_numpy(dtype=bool)
+        for pattern in OUTCOME_PATTERNS.values()
+    ]
+    return np.select(masks, list(OUTCOME_PATTERNS), default='no_reply').astype(object)
+
+
+# =============================================================================
+# CELL HELPERS
+# =============================================================================
+
+def _cell(value):
+    """Return a raw cell value, or None for an empty (NaN/None) cell."""
+    # NaN and NaT are the only scalars that compare unequal to themselves
+    return None if value is None or value != value else value
+
+
 # =============================================================================
 # CONTACT DEDUPLICATION
 # =============================================================================
 
-def make_dedup_key(name: str, city: str) -> str:
-    """Create deduplication key from name + city."""
-    name_clean = str(name).strip().lower() if name else ''
-    city_clean = str(city).strip().lower() if city else ''
-    return f"{name_clean}|{city_clean}"
+def make_dedup_key(name: str, city: str) -> Tuple[str, str]:
+    """
+    Create deduplication key from name + city.
+    Normalization mirrors the SQL lower(btrim(...)) used by the DB lookup and
+    the unique dedup index, so only spaces are trimmed: btrim() keeps tabs and
+    newlines, and a key that strips them would miss the preloaded id.
+    """
+    name_clean = str(name).strip(' ').lower() if name else ''
+    city_clean = str(city).strip(' ').lower() if city else ''
+    return (name_clean, city_clean)
+
+
+def make_dedup_keys(names, cities) -> List[Tuple[str, str]]:
+    """
+    Vectorized make_dedup_key() over whole name and city columns.
+    Empty (NaN/None) cells normalize to '', like a missing name or city.
+    """
+    name_keys = _normalize_keys(pd.Series(names, dtype=object))
+    city_keys = _normalize_keys(pd.Series(cities, dtype=object))
+    return list(zip(name_keys, city_keys))
+
+
+def _normalize_keys(values: pd.Series) -> pd.Series:
+    """Column-wise make_dedup_key() normalization, with '' for empty cells."""
+    return values.where(values.notna(), '').astype(str).str.strip(' ').str.lower()
 
 
-def make_unique_name(name: str, city: str, existing_names: Dict[str, int]) -> str:
+def make_unique_name(name: str, city: str, existing_names: Dict[Tuple[str, str], int]) -> str:
     """
     Make a unique name by appending city.
     If duplicate, format as "Name (City)".
@@ -132,37 +255,61 @@ def make_unique_name(name: str, city: str, existing_names: Dict[str, int]) -> st
         return name
 
 
+def make_unique_names(names: pd.Series, cities: pd.Series) -> np.ndarray:
+    """
+    Vectorized make_unique_name() over whole name and city columns.
+    Every repeat of an earlier name + city key gets " (City)" appended
+    when it has a city; first occurrences keep their name.
+    """
+    names = names.astype(object)
+    cities = cities.astype(object)
+
+    city_keys = _normalize_keys(cities)
+    repeat = pd.DataFrame({'name': _normalize_keys(names), 'city': city_keys}).duplicated().to_numpy()
+    with_city = names.astype(str) + ' (' + cities.astype(str) + ')'
+    return np.where(repeat & (city_keys != '').to_numpy(), with_city, names).astype(object)
+
+
 # =============================================================================
 # FUZZY VENUE MATCHING
 # =============================================================================
 
+def venue_choices(contacts: List[Dict]) -> Dict[int, str]:
+    """Build the {contact_id: lowercased name} choices fuzzy matching scores against."""
+    return {
+        contact['id']: contact['name'].lower()
+        for contact in contacts
+        if contact.get('name')
+    }
+
+
 def fuzzy_match_venue(venue_name: str, contacts: List[Dict], threshold: int = 80) -> Optional[int]:
     """
     Fuzzy match venue name against contacts using Levenshtein distance.
     Returns contact_id if match found above threshold, else None.
     """
-    if not venue_name:
-        return None
-
-    best_score = 0
-    best_match_id = None
+    return fuzzy_match_venue_prepared(venue_name, venue_choices(contacts), threshold)
 
-    for contact in contacts:
-        contact_name = contact.get('name', '')
-        if not contact_name:
-            continue
 
-        score = fuzz.ratio(venue_name.lower(), contact_name.lower())
+def fuzzy_match_venue_prepared(venue_name: str, choices: Dict[int, str], threshold: int = 80) -> Optional[int]:
+    """
+    Like fuzzy_match_venue(), but against choices already built by venue_choices(),
+    so callers matching many venues normalize the contact names only once.
+    """
+    if not venue_name:
+        return None
 
-        if score > best_score:
-            best_score = score
-            best_match_id = contact['id']
+    # extractOne scores all choices in C and returns the first best match
+    # as (name, score, contact_id); names are lowercased already, so no processor
+    match = process.extractOne(venue_name.lower(), choices, scorer=fuzz.ratio, processor=None)
+    best_match_id = match[2] if match else None
+    best_score = match[1] if match else 0
 
     if best_score >= threshold:
-        logger.info(f"Fuzzy matched '{venue_name}' to contact ID {best_match_id} (score: {best_score})")
+        logger.info("Fuzzy matched '%s' to contact ID %s (score: %s)", venue_name, best_match_id, best_score)
         return best_match_id
     else:
-        logger.warning(f"No fuzzy match found for venue '{venue_name}' (best score: {best_score})")
+        logger.warning("No fuzzy match found for venue '%s' (best score: %s)", venue_name, best_score)
         return None
 
 
@@ -205,6 +352,29 @@ class DatabaseConnection:
             self.cursor.execute(query, params)
             return self.cursor
 
+    def execute_values(self, query: str, rows: List[tuple], template: str = None,
+                       page_size: int = 1000, fetch: bool = False):
+        """
+        Execute a 'VALUES %s' query for many rows in one round-trip per page (or log in dry-run mode).
+        With fetch=True, returns the rows produced by a RETURNING clause.
+        """
+        if self.dry_run:
+            logger.info(f"[DRY-RUN] Would execute: {query[:100]}... with {len(rows)} rows")
+            return [] if fetch else None
+        else:
+            result = execute_values(self.cursor, query, rows, template=template,
+                                    page_size=page_size, fetch=fetch)
+            return result if fetch else self.cursor
+
+    def copy_expert(self, query: str, file):
+        """Stream a file-like object through a COPY ... FROM STDIN query (or log in dry-run mode)."""
+        if self.dry_run:
+            logger.info(f"[DRY-RUN] Would execute: {query[:100]}...")
+            return None
+        else:
+            self.cursor.copy_expert(query, file)
+            return self.cursor
+
     def fetchone(self):
         if self.dry_run:
             return None
@@ -216,32 +386,55 @@ class DatabaseConnection:
         return self.cursor.fetchall()
 
 
-def get_or_create_contact(db: DatabaseConnection, contact_data: Dict, dedup_key: str) -> Optional[int]:
+def load_existing_contact_ids(db: DatabaseConnection) -> Dict[Tuple[str, str], int]:
+    """
+    Load all live contacts in one query, keyed like make_dedup_key().
+    Returns an empty dict in dry-run mode.
+    """
+    if db.dry_run:
+        return {}
+
+    db.execute("""
+        SELECT id,
+               lower(btrim(name)) AS name_norm,
+               lower(btrim(coalesce(city, ''))) AS city_norm
+        FROM contacts
+        WHERE deleted_at IS NULL
+        ORDER BY id
+    """)
+
+    existing_ids = {}
+    for row in db.fetchall():
+        # Keep the oldest contact if the DB already holds duplicates
+        existing_ids.setdefault((row['name_norm'], row['city_norm']), row['id'])
+    return existing_ids
+
+
+def get_or_create_contact(db: DatabaseConnection, contact_data: Dict, dedup_key: Tuple[str, str],
+                          existing_ids: Optional[Dict[Tuple[str, str], int]] = None) -> Optional[int]:
     """
     Get existing contact by dedup key, or create new one.
+    With existing_ids (from load_existing_contact_ids) a known contact is a dict
+    hit. Otherwise a single INSERT ... ON CONFLICT on the unique dedup index
+    (migration 005) either creates the contact or returns the existing id;
+    the id is added to existing_ids.
     Returns contact_id or None if dry-run.
     """
-    # Check if contact exists
-    if not db.dry_run:
-        db.execute("""
-            SELECT id FROM contacts
-            WHERE deleted_at IS NULL
-              AND LOWER(TRIM(name)) = LOWER(TRIM(%s))
-              AND LOWER(TRIM(COALESCE(city, ''))) = LOWER(TRIM(COALESCE(%s, '')))
-        """, (contact_data['name'], contact_data.get('city', '')))
-
-        existing = db.fetchone()
-        if existing:
-            logger.info(f"Contact exists: {contact_data['name']} - ID {existing['id']}")
-            # TODO: Update empty fields (Phase 4 requirement)
-            return existing['id']
+    lookup_key = make_dedup_key(contact_data['name'], contact_data.get('city'))
 
-    # Create new contact
-    logger.info(f"Creating new contact: {contact_data['name']}")
+    if existing_ids is not None and lookup_key in existing_ids:
+        existing_id = existing_ids[lookup_key]
+        logger.info("Contact exists: %s - ID %s", contact_data['name'], existing_id)
+        # TODO: Update empty fields (Phase 4 requirement)
+        return existing_id
 
     if db.dry_run:
+        logger.info("Creating new contact: %s", contact_data['name'])
         return None  # Would create, but in dry-run
 
+    # The DO UPDATE leaves the existing row's data as is (only the updated_at
+    # trigger fires) but makes RETURNING yield it on a match; xmax = 0 only
+    # for a freshly inserted row
     db.execute("""
         INSERT INTO contacts (
             name, type, subtype, city, country, address, website, email,
@@ -250,29 +443,207 @@ def get_or_create_contact(db: DatabaseConnection, contact_data: Dict, dedup_key:
             %(name)s, %(type)s, %(subtype)s, %(city)s, %(country)s, %(address)s,
             %(website)s, %(email)s, %(phone)s, %(preferred_language)s,
             %(status)s, %(notes)s, NOW(), NOW()
-        ) RETURNING id
+        )
+        ON CONFLICT (lower(btrim(name)), lower(btrim(coalesce(city, ''))))
+            WHERE deleted_at IS NULL
+        DO UPDATE SET name = contacts.name
+        RETURNING id, (xmax = 0) AS inserted
     """, contact_data)
 
     result = db.fetchone()
-    return result['id'] if result else None
+    contact_id = result['id'] if result else None
+    if result and result['inserted']:
+        logger.info("Created new contact: %s - ID %s", contact_data['name'], contact_id)
+    elif result:
+        logger.info("Contact exists: %s - ID %s", contact_data['name'], contact_id)
 
+    if contact_id and existing_ids is not None:
+        existing_ids[lookup_key] = contact_id
+    return contact_id
 
-def create_interaction(db: DatabaseConnection, interaction_data: Dict):
-    """Create an interaction record."""
-    logger.debug(f"Creating interaction for contact {interaction_data['contact_id']}: {interaction_data['summary'][:50]}...")
 
-    if db.dry_run:
-        return
+def insert_contacts(db: DatabaseConnection, contacts: List[Dict]) -> List[Optional[int]]:
+    """
+    Create many new contacts at once.
+    Small batches go in one multi-row INSERT; from COPY_THRESHOLD rows on they
+    are streamed with COPY into a temp table and inserted from there. Both
+    upsert on the unique dedup index (migration 005), so a contact the preload
+    missed (added since, or lower-cased differently by PostgreSQL) gets its
+    existing id instead of failing the batch.
+    Returns the contact ids in input order (all None in dry-run mode).
+    """
+    for contact in contacts:
+        logger.info("Creating new contact: %s", contact['name'])
 
-    db.execute("""
-        INSERT INTO interactions (
-            contact_id, interaction_date, method, direction, summary,
-            outcome, next_action, next_action_date, created_at
-        ) VALUES (
-            %(contact_id)s, %(interaction_date)s, %(method)s, %(direction)s,
-            %(summary)s, %(outcome)s, %(next_action)s, %(next_action_date)s, NOW()
+    if db.dry_run or not contacts:
+        return [None] * len(contacts)
+
+    # COPY (FORMAT csv) reads an empty field as NULL, so '' is sent as None on
+    # both paths and the stored values are the same whichever path a batch takes.
+    # Each row carries its input position (ord) to match the ids back on.
+    rows = [
+        (i, *(None if contact[col] == '' else contact[col] for col in CONTACT_COLUMNS))
+        for i, contact in enumerate(contacts)
+    ]
+    columns = ', '.join(CONTACT_COLUMNS)
+
+    if len(rows) >= COPY_THRESHOLD:
+        db.execute(f"""
+            CREATE TEMP TABLE contacts_import AS
+            SELECT 0 AS ord, {columns} FROM contacts WITH NO DATA
+        """)
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        buffer.seek(0)
+        db.copy_expert(f"COPY contacts_import (ord, {columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+        db.execute(_upsert_contacts_sql("SELECT * FROM contacts_import"))
+        returned = db.fetchall()
+        db.execute("DROP TABLE contacts_import")
+    else:
+        returned = db.execute_values(
+            _upsert_contacts_sql(f"SELECT * FROM (VALUES %s) AS v(ord, {columns})"), rows,
+            template=f"({', '.join(['%s'] * len(rows[0]))})", fetch=True)
+
+    existing = sum(not row['inserted'] for row in returned)
+    if existing:
+        logger.info("%d new contacts already existed in the database; using their ids", existing)
+
+    # RETURNING order is not guaranteed, so ids are matched back on ord
+    ids = {row['ord']: row['id'] for row in returned}
+    return [ids.get(i) for i in range(len(rows))]
+
+
+def _upsert_contacts_sql(source: str) -> str:
+    """
+    Upsert the (ord, CONTACT_COLUMNS) rows selected by source into contacts.
+    On a dedup-index conflict RETURNING gives the existing row, spelled as
+    stored, so rows are joined back to their input on the index's own key.
+    Yields (ord, id, inserted) per input row.
+    """
+    columns = ', '.join(CONTACT_COLUMNS)
+    return f"""
+        WITH batch AS ({source}),
+        upserted AS (
+            INSERT INTO contacts ({columns}, created_at, updated_at)
+            SELECT {columns}, NOW(), NOW() FROM batch
+            ON CONFLICT (lower(btrim(name)), lower(btrim(coalesce(city, ''))))
+                WHERE deleted_at IS NULL
+                DO UPDATE SET name = contacts.name
+            RETURNING id, name, city, (xmax = 0) AS inserted
         )
-    """, interaction_data)
+        SELECT batch.ord, upserted.id, upserted.inserted
+        FROM batch
+        JOIN upserted
+          ON lower(btrim(upserted.name)) = lower(btrim(batch.name))
+         AND lower(btrim(coalesce(upserted.city, ''))) = lower(btrim(coalesce(batch.city, '')))
+    """
+
+
+def insert_interactions(db: DatabaseConnection, interactions: pd.DataFrame):
+    """Create interaction records (one per row, INTERACTION_COLUMNS) in one multi-row INSERT."""
+    # Per-row records are lazy, and the loop itself only runs when DEBUG is on
+    if logger.isEnabledFor(logging.DEBUG):
+        for contact_id, summary in zip(interactions['contact_id'], interactions['summary']):
+            logger.debug("Creating interaction for contact %s: %s...", contact_id, summary[:50])
+
+    if db.dry_run or interactions.empty:
+        return
+
+    db.execute_values(f"""
+        INSERT INTO interactions ({', '.join(INTERACTION_COLUMNS)}, created_at)
+        VALUES %s
+    """, list(interactions[list(INTERACTION_COLUMNS)].itertuples(index=False, name=None)),
+        template=f"({', '.join(['%s'] * len(INTERACTION_COLUMNS))}, NOW())")
+
+
+def update_contact_statuses(db: DatabaseConnection, status_updates: Dict[int, str]):
+    """Apply all {contact_id: status} updates in a single UPDATE statement."""
+    if db.dry_run or not status_updates:
+        return
+
+    logger.info(f"Updating status for {len(status_updates)} contacts")
+
+    db.execute_values("""
+        UPDATE contacts
+        SET status = v.status, updated_at = NOW()
+        FROM (VALUES %s) AS v(id, status)
+        WHERE contacts.id = v.id
+    """, list(status_updates.items()))
+
+
+# =============================================================================
+# SHEET READING
+# =============================================================================
+
+def read_sheet(excel_file, sheet_name: str) -> pd.DataFrame:
+    """
+    Parse one sheet without header, limited to the columns its importer uses.
+    excel_file is a pd.ExcelFile / path, or the {sheet_name: DataFrame} dict
+    returned by read_sheets().
+    """
+    if isinstance(excel_file, dict):
+        return excel_file[sheet_name]
+    if sheet_name in STREAMED_SHEETS:
+        return stream_sheet(excel_file, sheet_name)
+    # A pd.ExcelFile already carries its engine; pandas rejects a second one
+    engine = None if isinstance(excel_file, pd.ExcelFile) else EXCEL_ENGINE
+    # Imported sheets are read as dtype=object: raw cell values, no per-column
+    # type inference (header rows mix text into every column anyway), and
+    # dates stay unparsed since the importers check for real date cells.
+    # Notes sheets keep pandas' inferred dtypes for their markdown export.
+    usecols = SHEET_USECOLS.get(sheet_name)
+    return pd.read_excel(excel_file, sheet_name=sheet_name, header=None, usecols=usecols,
+                         dtype=object if usecols else None, engine=engine)
+
+
+def stream_sheet(excel_file, sheet_name: str) -> pd.DataFrame:
+    """
+    Read a sheet's used columns straight from openpyxl's read-only row iterator.
+    Skips the per-cell conversion pd.read_excel applies to every column; cells
+    keep their raw openpyxl values (None when empty, datetime for dates).
+    Column labels keep their spreadsheet positions.
+    """
+    usecols = SHEET_USECOLS[sheet_name]
+
+    # An openpyxl-backed pd.ExcelFile already holds the workbook open in read-only mode
+    if isinstance(excel_file, pd.ExcelFile) and excel_file.engine == 'openpyxl':
+        workbook, owned = excel_file.book, False
+    else:
+        workbook, owned = openpyxl.load_workbook(excel_file, read_only=True, data_only=True), True
+
+    try:
+        rows = workbook[sheet_name].iter_rows(max_col=max(usecols) + 1, values_only=True)
+        df = pd.DataFrame.from_records(rows, columns=range(max(usecols) + 1))
+    finally:
+        if owned:
+            workbook.close()
+
+    return df[usecols]
+
+
+def read_sheets(path: Path, sheet_names: List[str], max_workers: int = 4,
+                best_effort: Iterable[str] = ()) -> Dict[str, pd.DataFrame]:
+    """
+    Parse several sheets at once in worker processes.
+    openpyxl parses in pure Python and holds the GIL, so threads would not overlap.
+    A sheet named in best_effort that fails to parse is logged and left out;
+    any other failure is raised.
+    """
+    if not sheet_names:
+        return {}
+
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(sheet_names))) as pool:
+        futures = {name: pool.submit(read_sheet, path, name) for name in sheet_names}
+
+    sheets = {}
+    for name, future in futures.items():
+        try:
+            sheets[name] = future.result()
+        except Exception as e:
+            if name not in best_effort:
+                raise
+            logger.error("Error reading sheet '%s': %s", name, e)
+    return sheets
 
 
 # =============================================================================
@@ -288,8 +659,10 @@ def import_contacts_leads(db: DatabaseConnection, excel_file) -> Tuple[int, int,
     logger.info("IMPORTING: contacts  leads")
     logger.info("=" * 80)
 
-    # Read sheet without header, we'll extract it manually
-    df = pd.read_excel(excel_file, sheet_name="contacts  leads", header=None)
+    # Read sheet without header, we'll extract it manually.
+    # Only the attempt columns (3-7) and contact fields (13-20) are parsed;
+    # column labels keep their spreadsheet positions.
+    df = read_sheet(excel_file, "contacts  leads")
 
     # Row 3 has headers
     headers = df.iloc[3].tolist()
@@ -303,139 +676,149 @@ def import_contacts_leads(db: DatabaseConnection, excel_file) -> Tuple[int, int,
     updated = 0
     skipped = 0
 
-    existing_names = {}
+    # One query for every existing contact instead of a SELECT per row
+    existing_ids = load_existing_contact_ids(db)
+
+    # Slice the data block once; reindex guarantees every spreadsheet
+    # column up to 20 exists, even for short sheets.
+    data = df.iloc[data_start:].reindex(columns=range(21))
+
+    # Filter rows once with boolean masks instead of per-row checks.
+    # Column 13 is name (blank cells and repeated "name" headers are not
+    # contacts); column 14 is sub_city, where "people" marks a person.
+    names = data[13]
+    is_contact = names.notna() & ~names.isin(['', 'name'])
+    is_person = is_contact & (data[14] == 'people')
+
+    if logger.isEnabledFor(logging.DEBUG):
+        for person in names[is_person]:
+            logger.debug("Skipping person: %s", person)
+    skipped += int(is_person.sum())
+
+    data = data[is_contact & ~is_person]
+
+    # All attempt cells flattened row by row into one Series, so each step
+    # below is a single vectorized pass over every cell; results are
+    # reshaped so [row_pos, k] addresses ATTEMPT_SPEC[k] in that row.
+    shape = (len(data), len(ATTEMPT_SPEC))
+    attempt_cells = pd.Series(
+        data[[col_idx for col_idx, _, _ in ATTEMPT_SPEC]].to_numpy(dtype=object).ravel()
+    )
 
-    for idx in range(data_start, len(df)):
-        row = df.iloc[idx]
+    # One regex pass per outcome instead of a keyword loop per cell
+    outcomes = infer_outcomes(attempt_cells).reshape(shape)
 
-        # Column 13 is name
-        name = row[13] if pd.notna(row[13]) else None
-        if not name or name == 'name':
-            continue
+    # Stripped text ('' when empty); has_attempt marks the cells that become interactions
+    attempt_texts = (
+        attempt_cells.where(attempt_cells.notna(), '').astype(str).str.strip()
+        .to_numpy(dtype=object).reshape(shape)
+    )
+    has_attempt = attempt_texts != ''
+
+    # Interaction dates for every attempt cell, also computed column-wise.
+    # Column 3 anchors the schedule only when it holds a real date (text such
+    # as "yes" does not); rows without an anchor count back from today.
+    # interaction_dates[row_pos, k] is the date of ATTEMPT_SPEC[k] in that row.
+    first_contact = data[3].where(data[3].map(lambda v: isinstance(v, datetime)))
+    anchors = pd.to_datetime(first_contact).dt.normalize().to_numpy()
+    offsets = np.array([30 * months for _, _, months in ATTEMPT_SPEC], dtype='timedelta64[D]')
+    fallback = np.datetime64(datetime.now().date()) - (np.timedelta64(30 * 20, 'D') - offsets)
+    anchored = anchors[:, None] + offsets
+    interaction_dates = (
+        np.where(np.isnat(anchored), fallback, anchored)
+        .astype('datetime64[D]')
+        .astype(object)  # datetime.date values for psycopg2
+    )
 
-        # Column 14 is sub_city (city)
-        city = row[14] if pd.notna(row[14]) and len(row) > 14 else None
+    # Contacts not yet in the DB are collected and inserted in one batch after
+    # the loop; each imported row points at either an existing id or its
+    # position in new_contacts.
+    new_contacts = []
+    new_positions = {}  # dedup key -> position in new_contacts
+    row_contacts = []   # per row: (existing contact_id, new_contacts position)
 
-        # Skip if this is a "people" entry (city == "people")
-        if city == 'people':
-            logger.debug(f"Skipping person: {name}")
-            skipped += 1
-            continue
+    # "Name (City)" for repeated name + city keys, in one pass over the columns,
+    # and the normalized lookup key of every row from the same columns
+    unique_names = make_unique_names(data[13], data[14])
+    lookup_keys = make_dedup_keys(unique_names, data[14])
 
-        # Make unique name if duplicate
-        unique_name = make_unique_name(name, city, existing_names)
-        dedup_key = make_dedup_key(name, city)
+    # Contact fields (columns 13-20) as plain object arrays, zipped per row;
+    # the attempt columns were already handled column-wise above
+    contact_fields = zip(*(data[col].to_numpy(dtype=object) for col in range(13, 21)))
+
+    for row_pos, (_, city, address, contact_type, subtype, website, email, notes) in enumerate(contact_fields):
+        # Column 14 is sub_city (city)
+        city = _cell(city)
+
+        unique_name = unique_names[row_pos]
 
         # Extract contact fields
         contact_data = {
             'name': unique_name,
             'city': city,
-            'address': row[15] if len(row) > 15 and pd.notna(row[15]) else None,
-            'type': row[16] if len(row) > 16 and pd.notna(row[16]) else None,
-            'subtype': row[17] if len(row) > 17 and pd.notna(row[17]) else None,
-            'website': row[18] if len(row) > 18 and pd.notna(row[18]) else None,
-            'email': row[19] if len(row) > 19 and pd.notna(row[19]) else None,
+            'address': _cell(address),
+            'type': _cell(contact_type),
+            'subtype': _cell(subtype),
+            'website': _cell(website),
+            'email': _cell(email),
             'phone': None,  # Not in spreadsheet
             'preferred_language': 'de',  # Default for Bavaria
             'status': 'cold',  # Will be updated from interactions
-            'notes': row[20] if len(row) > 20 and pd.notna(row[20]) else None,
+            'notes': _cell(notes),
             'country': 'DE',  # Assume Germany unless specified
         }
 
-        # Get or create contact
-        contact_id = get_or_create_contact(db, contact_data, dedup_key)
-
+        # Look up the contact, or queue it for creation
+        lookup_key = lookup_keys[row_pos]
+        contact_id = existing_ids.get(lookup_key)
+        new_pos = None
         if contact_id:
-            created += 1
+            logger.info("Contact exists: %s - ID %s", unique_name, contact_id)
+            # TODO: Update empty fields (Phase 4 requirement)
         else:
-            if db.dry_run:
-                created += 1  # Count as would-create in dry-run
-            else:
-                skipped += 1
-                continue
-
-        # Parse 5 attempt columns and create interactions
-        # Column 3: first contact (has date)
-        # Column 4: second
-        # Column 5: third
-        # Column 6: forth
-        # Column 7: fifth
-
-        first_contact_date = row[3] if len(row) > 3 and pd.notna(row[3]) else None
-
-        # Convert to date if it's a timestamp, or None if it's not a date
-        if first_contact_date:
-            if isinstance(first_contact_date, pd.Timestamp):
-                first_contact_date = first_contact_date.date()
-            elif isinstance(first_contact_date, datetime):
-                first_contact_date = first_contact_date.date()
-            else:
-                # Not a date (e.g., "yes" or other text), set to None
-                first_contact_date = None
-
-        attempts = [
-            (3, 'first contact', 0),   # col, label, months_offset
-            (4, 'second', 5),
-            (5, 'third', 10),
-            (6, 'forth', 15),
-            (7, 'fifth', 20),
-        ]
-
-        latest_outcome = None
-
-        for col_idx, label, months_offset in attempts:
-            if len(row) <= col_idx:
-                continue
+            new_pos = new_positions.get(lookup_key)
+            if new_pos is None:
+                new_pos = new_positions[lookup_key] = len(new_contacts)
+                new_contacts.append(contact_data)
+        created += 1
 
-            attempt_text = row[col_idx]
-            if pd.isna(attempt_text) or not str(attempt_text).strip():
-                continue
+        row_contacts.append((contact_id, new_pos))
 
-            # Calculate interaction date
-            if first_contact_date and months_offset == 0:
-                interaction_date = first_contact_date
-            elif first_contact_date:
-                interaction_date = first_contact_date + timedelta(days=30 * months_offset)
-            else:
-                # No anchor date, use import date minus offset
-                interaction_date = datetime.now().date() - timedelta(days=30 * (20 - months_offset))
-
-            # Infer outcome
-            outcome = infer_outcome(attempt_text)
-            latest_outcome = outcome  # Track last outcome for status update
-
-            interaction_data = {
-                'contact_id': contact_id if contact_id else 0,
-                'interaction_date': interaction_date,
-                'method': 'unknown',
-                'direction': 'outbound',
-                'summary': str(attempt_text).strip(),
-                'outcome': outcome,
-                'next_action': None,
-                'next_action_date': None,
-            }
-
-            if contact_id or db.dry_run:
-                create_interaction(db, interaction_data)
-
-        # Update contact status based on latest interaction outcome
-        if not db.dry_run and contact_id and latest_outcome:
-            status_map = {
-                'no_reply': 'contacted',
-                'interested': 'meeting',
-                'rejected': 'rejected',
-                'meeting_set': 'meeting',
-                'proposal_requested': 'proposal',
-                'accepted': 'accepted',
-                'not_interested': 'rejected',
-            }
-            new_status = status_map.get(latest_outcome, 'contacted')
+    new_ids = insert_contacts(db, new_contacts)
 
-            db.execute("""
-                UPDATE contacts
-                SET status = %s, updated_at = NOW()
-                WHERE id = %s
-            """, (new_status, contact_id))
+    # Contact id per data row (None in dry-run, where nothing is inserted)
+    contact_ids = np.array(
+        [new_ids[new_pos] if new_pos is not None else contact_id for contact_id, new_pos in row_contacts],
+        dtype=object,
+    )
+    has_contact = np.array([bool(contact_id) for contact_id in contact_ids], dtype=bool)
+
+    # Interactions in long form: one row per non-empty attempt cell, in sheet
+    # order (row by row, attempts left to right), taken straight from the
+    # [row, attempt] matrices. Dry-run keeps rows without an id (as contact 0).
+    rows, ks = np.nonzero(has_attempt & (has_contact | db.dry_run)[:, None])
+    interactions = pd.DataFrame({
+        'contact_id': np.where(has_contact[rows], contact_ids[rows], 0),
+        'interaction_date': interaction_dates[rows, ks],
+        'method': 'unknown',
+        'direction': 'outbound',
+        'summary': attempt_texts[rows, ks],
+        'outcome': outcomes[rows, ks],
+        'next_action': None,
+        'next_action_date': None,
+    }, columns=list(INTERACTION_COLUMNS), dtype=object)
+
+    # Contact status from each row's latest (right-most) attempt outcome,
+    # mapped through STATUS_MAP for all rows at once; a dict, so the last
+    # row wins if two rows map to the same contact
+    last_k = len(ATTEMPT_SPEC) - 1 - np.argmax(has_attempt[:, ::-1], axis=1)
+    latest_outcomes = outcomes[np.arange(len(data)), last_k]
+    latest_statuses = pd.Series(latest_outcomes, dtype=object).map(STATUS_MAP).fillna('contacted').to_numpy()
+    status_rows = np.flatnonzero(has_contact & has_attempt.any(axis=1))
+    status_updates = dict(zip(contact_ids[status_rows], latest_statuses[status_rows]))
+
+    insert_interactions(db, interactions)
+    update_contact_statuses(db, status_updates)
 
     logger.info(f"Contacts: {created} created, {updated} updated, {skipped} skipped")
     return (created, updated, skipped)
@@ -450,7 +833,9 @@ def import_show_dates(db: DatabaseConnection, excel_file) -> int:
     logger.info("IMPORTING: show dates")
     logger.info("=" * 80)
 
-    df = pd.read_excel(excel_file, sheet_name="show dates", header=None)
+    # Only columns 1-4 are used; reindex so row[N] stays positional
+    df = read_sheet(excel_file, "show dates")
+    df = df.reindex(columns=range(5))
 
     created = 0
 
@@ -461,6 +846,9 @@ def import_show_dates(db: DatabaseConnection, excel_file) -> int:
     else:
         contacts = []
 
+    # Normalize contact names once, not once per show row
+    choices = venue_choices(contacts)
+
     # Data starts around row 4
     for idx in range(4, len(df)):
         row = df.iloc[idx]
@@ -475,14 +863,14 @@ def import_show_dates(db: DatabaseConnection, excel_file) -> int:
         theme = row[4] if len(row) > 4 and pd.notna(row[4]) else None
 
         # Try to parse dates (this is rough, real dates would need better parsing)
-        date_start = None
+        # Only real date cells give a start date. pd.Timestamp subclasses
+        # datetime, so one check covers both; day ranges like "26 27" and bare
+        # day numbers stay unparsed (to_datetime would read ints as epoch offsets)
+        date_start = date_str.date() if isinstance(date_str, datetime) else None
         date_end = None
 
-        if isinstance(date_str, pd.Timestamp) or isinstance(date_str, datetime):
-            date_start = date_str.date() if isinstance(date_str, datetime) else date_str
-
         # Fuzzy match venue to contacts
-        venue_contact_id = fuzzy_match_venue(venue_name, contacts, threshold=70)
+        venue_contact_id = fuzzy_match_venue_prepared(venue_name, choices, threshold=70)
 
         show_data = {
             'name': f"{venue_name} - {month_str}" if month_str else venue_name,
@@ -495,7 +883,7 @@ def import_show_dates(db: DatabaseConnection, excel_file) -> int:
             'notes': None,
         }
 
-        logger.info(f"Creating show: {show_data['name']}")
+        logger.info("Creating show: %s", show_data['name'])
 
         if not db.dry_run:
             db.execute("""
@@ -523,10 +911,13 @@ def import_online_platforms(db: DatabaseConnection, excel_file) -> int:
     logger.info("IMPORTING: on line")
     logger.info("=" * 80)
 
-    df = pd.read_excel(excel_file, sheet_name="on line", header=None)
+    # Only columns 2 and 6-9 are used; reindex so row[N] stays positional
+    df = read_sheet(excel_file, "on line")
+    df = df.reindex(columns=range(10))
 
     created = 0
     existing_names = {}
+    existing_ids = load_existing_contact_ids(db)
 
     # Row 1 appears to be headers: Col 2: name, Col 9: website
     # Data starts around row 4
@@ -573,7 +964,7 @@ def import_online_platforms(db: DatabaseConnection, excel_file) -> int:
         }
 
         dedup_key = make_dedup_key(name, 'online')
-        contact_id = get_or_create_contact(db, contact_data, dedup_key)
+        contact_id = get_or_create_contact(db, contact_data, dedup_key, existing_ids)
 
         if contact_id:
             created += 1
@@ -595,38 +986,35 @@ def export_notes_sheets(excel_file) -> int:
 
     NOTES_DIR.mkdir(exist_ok=True)
 
-    notes_sheets = [
-        'plans',
-        'notes  ideas',
-        'gofundme options',
-        'notes - live painting',
-        'helpers',
-        'ideas',
-    ]
-
     created = 0
+    available = set(excel_file if isinstance(excel_file, dict) else excel_file.sheet_names)
 
-    for sheet_name in notes_sheets:
-        if sheet_name not in excel_file.sheet_names:
+    for sheet_name in NOTES_SHEETS:
+        if sheet_name not in available:
             continue
 
         try:
-            df = pd.read_excel(excel_file, sheet_name=sheet_name, header=None)
+            df = read_sheet(excel_file, sheet_name)
 
             # Convert to markdown
             filename = sheet_name.replace(' ', '_').replace('-', '_') + '.md'
             filepath = NOTES_DIR / filename
 
-            with open(filepath, 'w') as f:
-                f.write(f"# {sheet_name}\n\n")
-                f.write(f"Exported from art-marketing.xlsx on {datetime.now().strftime('%Y-%m-%d')}\n\n")
-                f.write("---\n\n")
+            lines = [
+                f"# {sheet_name}\n\n",
+                f"Exported from art-marketing.xlsx on {datetime.now().strftime('%Y-%m-%d')}\n\n",
+                "---\n\n",
+            ]
+
+            # Non-empty rows; itertuples yields plain tuples, no Series per row
+            for row in df.itertuples(index=False, name=None):
+                row_text = ' | '.join(str(val) for val in row if _cell(val) is not None)
+                if row_text.strip():
+                    lines.append(f"{row_text}\n\n")
 
-                # Write non-empty rows
-                for idx, row in df.iterrows():
-                    row_text = ' | '.join([str(val) for val in row if pd.notna(val)])
-                    if row_text.strip():
-                        f.write(f"{row_text}\n\n")
+            # One buffered write for the whole file
+            with open(filepath, 'w', buffering=1 << 20) as f:
+                f.writelines(lines)
 
             logger.info(f"Exported: {filename}")
             created += 1
@@ -642,6 +1030,24 @@ def export_notes_sheets(excel_file) -> int:
 # MAIN IMPORT ORCHESTRATOR
 # =============================================================================
 
+def run_in_savepoint(db: DatabaseConnection, name: str, importer, *args):
+    """
+    Run one sheet importer inside a SAVEPOINT of the shared transaction.
+    On failure only that importer's writes are rolled back, then the error is re-raised.
+    """
+    if db.dry_run:
+        return importer(db, *args)
+
+    db.execute(f"SAVEPOINT {name}")
+    try:
+        result = importer(db, *args)
+    except Exception:
+        db.execute(f"ROLLBACK TO SAVEPOINT {name}")
+        raise
+    db.execute(f"RELEASE SAVEPOINT {name}")
+    return result
+
+
 def run_import(dry_run: bool = False, log_level: str = "INFO"):
     """Main import function."""
 
@@ -649,11 +1055,19 @@ def run_import(dry_run: bool = False, log_level: str = "INFO"):
     log_file = Path.home() / "logs" / f"import_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
     log_file.parent.mkdir(exist_ok=True)
 
+    log_format = '%(asctime)s - %(levelname)s - %(message)s'
+
+    # Log file records are buffered and written in blocks of 1000 instead of
+    # one write per record; errors flush the buffer right away, and so does
+    # logging's shutdown at exit
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(logging.Formatter(log_format))
+
     logging.basicConfig(
         level=getattr(logging, log_level.upper()),
-        format='%(asctime)s - %(levelname)s - %(message)s',
+        format=log_format,
         handlers=[
-            logging.FileHandler(log_file),
+            logging.handlers.MemoryHandler(capacity=1000, target=file_handler),
             logging.StreamHandler()
         ]
     )
@@ -670,9 +1084,14 @@ def run_import(dry_run: bool = False, log_level: str = "INFO"):
         logger.error(f"Excel file not found: {XLSX_PATH}")
         return 1
 
-    # Load Excel file
+    # Load Excel file and parse the sheets we need in parallel. Every sheet is
+    # best-effort: one that cannot be parsed is left out, so only its own
+    # importer (or the notes export) fails and the other sheets still import.
     try:
-        excel_file = pd.ExcelFile(XLSX_PATH)
+        with pd.ExcelFile(XLSX_PATH, engine=EXCEL_ENGINE) as excel_file:
+            available = set(excel_file.sheet_names)
+        sheet_names = [name for name in (*SHEET_USECOLS, *NOTES_SHEETS) if name in available]
+        sheets = read_sheets(XLSX_PATH, sheet_names, best_effort=sheet_names)
     except Exception as e:
         logger.error(f"Failed to read Excel file: {e}")
         return 1
@@ -686,38 +1105,43 @@ def run_import(dry_run: bool = False, log_level: str = "INFO"):
         'errors': 0,
     }
 
-    # Import contacts & leads
-    try:
-        with DatabaseConnection(dry_run=dry_run) as db:
-            created, updated, skipped = import_contacts_leads(db, excel_file)
-            stats['contacts_created'] += created
-            stats['contacts_updated'] += updated
-            stats['contacts_skipped'] += skipped
-    except Exception as e:
-        logger.error(f"Error importing contacts: {e}", exc_info=True)
-        stats['errors'] += 1
-
-    # Import show dates
-    try:
-        with DatabaseConnection(dry_run=dry_run) as db:
-            created = import_show_dates(db, excel_file)
-            stats['shows_created'] += created
-    except Exception as e:
-        logger.error(f"Error importing shows: {e}", exc_info=True)
-        stats['errors'] += 1
-
-    # Import online platforms
+    # One connection and one transaction for all three sheet imports.
+    # Each importer runs in its own savepoint, so a failing sheet is rolled
+    # back on its own and the others still commit.
     try:
         with DatabaseConnection(dry_run=dry_run) as db:
-            created = import_online_platforms(db, excel_file)
-            stats['contacts_created'] += created
+            # Import contacts & leads
+            try:
+                created, updated, skipped = run_in_savepoint(db, 'import_contacts', import_contacts_leads, sheets)
+                stats['contacts_created'] += created
+                stats['contacts_updated'] += updated
+                stats['contacts_skipped'] += skipped
+            except Exception as e:
+                logger.error(f"Error importing contacts: {e}", exc_info=True)
+                stats['errors'] += 1
+
+            # Import show dates
+            try:
+                created = run_in_savepoint(db, 'import_shows', import_show_dates, sheets)
+                stats['shows_created'] += created
+            except Exception as e:
+                logger.error(f"Error importing shows: {e}", exc_info=True)
+                stats['errors'] += 1
+
+            # Import online platforms
+            try:
+                created = run_in_savepoint(db, 'import_online', import_online_platforms, sheets)
+                stats['contacts_created'] += created
+            except Exception as e:
+                logger.error(f"Error importing online platforms: {e}", exc_info=True)
+                stats['errors'] += 1
     except Exception as e:
-        logger.error(f"Error importing online platforms: {e}", exc_info=True)
+        logger.error(f"Database error: {e}", exc_info=True)
         stats['errors'] += 1
 
     # Export notes sheets to markdown
     try:
-        created = export_notes_sheets(excel_file)
+        created = export_notes_sheets(sheets)
         # (no stat tracking for notes files)
     except Exception as e:
         logger.error(f"Error exporting notes: {e}", exc_info=True)
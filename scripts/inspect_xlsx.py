@@ -8,6 +8,8 @@ import pandas as pd
 import sys
 from pathlib import Path
 
+from import_xlsx import EXCEL_ENGINE  # calamine when installed, else openpyxl
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
@@ -29,7 +31,7 @@ def inspect_spreadsheet():
 
     # Load Excel file
     try:
-        excel_file = pd.ExcelFile(XLSX_PATH)
+        excel_file = pd.ExcelFile(XLSX_PATH, engine=EXCEL_ENGINE)
     except Exception as e:
         print(f"ERROR: Could not read Excel file: {e}")
         return
@@ -52,9 +54,9 @@ def inspect_spreadsheet():
             print()
 
             print("Column names:")
-            for i, col in enumerate(df.columns, 1):
-                # Count non-empty values
-                non_empty = df[col].notna().sum()
+            # Count non-empty values for all columns at once
+            counts = df.notna().sum(axis=0)
+            for i, (col, non_empty) in enumerate(zip(df.columns, counts), 1):
                 pct = (non_empty / len(df) * 100) if len(df) > 0 else 0
                 print(f"  {i:2d}. {col:40s} ({non_empty:4d}/{len(df):4d} filled, {pct:5.1f}%)")
             print()
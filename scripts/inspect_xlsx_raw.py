@@ -8,21 +8,20 @@ import pandas as pd
 import sys
 from pathlib import Path
 
+from import_xlsx import EXCEL_ENGINE  # calamine when installed, else openpyxl
+
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 XLSX_PATH = project_root / "data" / "art-marketing.xlsx"
 
 
-def inspect_sheet_raw(sheet_name, excel_file, max_rows=10):
-    """Show raw data from a sheet."""
+def inspect_sheet_raw(sheet_name, df, max_rows=10):
+    """Show raw data from a sheet (df read without assuming headers)."""
     print("-" * 80)
     print(f"SHEET: {sheet_name}")
     print("-" * 80)
 
-    # Read without assuming headers
-    df = pd.read_excel(excel_file, sheet_name=sheet_name, header=None)
-
     print(f"Rows: {len(df)}, Columns: {len(df.columns)}")
     print()
 
@@ -30,11 +29,11 @@ def inspect_sheet_raw(sheet_name, excel_file, max_rows=10):
     print(f"First {min(max_rows, len(df))} rows (raw):")
     print()
 
+    values = df.to_numpy(dtype=object, na_value=None)
     for row_idx in range(min(max_rows, len(df))):
         print(f"Row {row_idx}:")
-        row = df.iloc[row_idx]
-        for col_idx, val in enumerate(row):
-            if pd.notna(val):
+        for col_idx, val in enumerate(values[row_idx]):
+            if val is not None:
                 # Truncate long values
                 val_str = str(val)
                 if len(val_str) > 80:
@@ -55,7 +54,8 @@ def main():
         print(f"ERROR: File not found: {XLSX_PATH}")
         return
 
-    excel_file = pd.ExcelFile(XLSX_PATH)
+    # Parse every sheet once; the listing below reuses the same frames
+    sheets = pd.read_excel(XLSX_PATH, sheet_name=None, header=None, engine=EXCEL_ENGINE)
 
     # Focus on the key sheets for import
     priority_sheets = [
@@ -66,18 +66,17 @@ def main():
     ]
 
     for sheet_name in priority_sheets:
-        if sheet_name in excel_file.sheet_names:
+        if sheet_name in sheets:
             try:
-                inspect_sheet_raw(sheet_name, excel_file, max_rows=15)
+                inspect_sheet_raw(sheet_name, sheets[sheet_name], max_rows=15)
             except Exception as e:
                 print(f"ERROR inspecting '{sheet_name}': {e}")
                 print()
 
     print("=" * 80)
     print("Want to see other sheets? Available sheets:")
-    for i, sheet in enumerate(excel_file.sheet_names, 1):
-        row_count = len(pd.read_excel(excel_file, sheet_name=sheet, header=None))
-        print(f"  {i:2d}. {sheet:30s} ({row_count:4d} rows)")
+    for i, (sheet, df) in enumerate(sheets.items(), 1):
+        print(f"  {i:2d}. {sheet:30s} ({len(df):4d} rows)")
     print("=" * 80)
 
 
@@ -11,6 +11,7 @@ from datetime import date, timedelta
 from typing import Optional
 
 from src.engine import crm
+from src.engine.crm import DuplicateContactError
 from src.models import Contact, Interaction, Show
 from src.logging_config import configure_logging, log_call
 
@@ -179,7 +180,11 @@ def contacts_add():
         notes=notes
     )
 
-    contact_id = crm.create_contact(contact)
+    try:
+        contact_id = crm.create_contact(contact)
+    except DuplicateContactError as e:
+        click.echo(f"\n{e}", err=True)
+        return
     click.echo(f"\n✓ Created contact #{contact_id}: {name}")
 
 
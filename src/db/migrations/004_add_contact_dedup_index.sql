@@ -0,0 +1,17 @@
+-- =============================================================================
+-- Migration 004: Index for Contact Deduplication Lookups
+-- =============================================================================
+-- The spreadsheet importer matches existing contacts on normalized name + city
+-- (lower/btrim, empty string for a missing city). An expression index on the
+-- same expressions lets that lookup use an index scan instead of evaluating
+-- LOWER(TRIM(...)) against every row.
+--
+-- An expression index (rather than generated name_norm/city_norm columns)
+-- keeps the contacts table shape unchanged, since the CRM engine builds
+-- Contact objects directly from SELECT * rows.
+--
+-- Created: 2026-10-16
+
+CREATE INDEX IF NOT EXISTS idx_contacts_dedup
+    ON contacts (lower(btrim(name)), lower(btrim(coalesce(city, ''))))
+    WHERE deleted_at IS NULL;
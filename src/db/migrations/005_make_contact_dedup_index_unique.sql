@@ -0,0 +1,23 @@
+-- =============================================================================
+-- Migration 005: Unique Contact Deduplication Key
+-- =============================================================================
+-- The importer and the lead scout both treat normalized name + city as the
+-- identity of a live contact. Making the migration 004 index unique lets the
+-- importer create-or-find a contact in a single
+-- INSERT ... ON CONFLICT ... RETURNING round-trip, and closes the window in
+-- which two concurrent writers could both insert the same contact.
+--
+-- Fails if live duplicates already exist; list them with:
+--   SELECT lower(btrim(name)), lower(btrim(coalesce(city, ''))), array_agg(id)
+--   FROM contacts WHERE deleted_at IS NULL
+--   GROUP BY 1, 2 HAVING count(*) > 1;
+-- and soft-delete or merge them before running this migration.
+--
+-- Created: 2026-10-16
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_contacts_dedup_unique
+    ON contacts (lower(btrim(name)), lower(btrim(coalesce(city, ''))))
+    WHERE deleted_at IS NULL;
+
+-- The unique index covers the same lookups
+DROP INDEX IF EXISTS idx_contacts_dedup;
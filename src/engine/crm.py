@@ -8,6 +8,8 @@ import logging
 from datetime import date, timedelta
 from typing import List, Optional, Dict, Any
 
+from psycopg2 import errors
+
 from src.db.connection import get_db_cursor
 from src.logging_config import log_call
 from src.models import Contact, Interaction, Show
@@ -27,6 +29,15 @@ _SHOW_COLUMNS = {
 }
 
 
+class DuplicateContactError(ValueError):
+    """A live contact with the same name + city (trimmed, case-insensitive) already exists."""
+
+    def __init__(self, contact: Contact, contact_id: Optional[int]):
+        self.contact_id = contact_id
+        city = f" in {contact.city}" if contact.city else ""
+        super().__init__(f"Contact '{contact.name}'{city} already exists (ID: {contact_id})")
+
+
 def _validate_columns(updates: Dict[str, Any], allowed: set, entity: str) -> None:
     """Raise ValueError if any key in updates is not an allowed column name."""
     invalid = set(updates.keys()) - allowed
@@ -43,28 +54,48 @@ def create_contact(contact: Contact) -> int:
     """
     Create a new contact.
     Returns: contact_id
+    Raises DuplicateContactError if a live contact has the same name + city.
     """
-    with get_db_cursor() as cur:
-        cur.execute("""
-            INSERT INTO contacts (
-                name, type, subtype, city, country, address, website, email,
-                phone, preferred_language, status, fit_score, success_probability,
-                best_visit_time, notes, created_at, updated_at
-            ) VALUES (
-                %(name)s, %(type)s, %(subtype)s, %(city)s, %(country)s, %(address)s,
-                %(website)s, %(email)s, %(phone)s, %(preferred_language)s, %(status)s,
-                %(fit_score)s, %(success_probability)s, %(best_visit_time)s, %(notes)s,
-                NOW(), NOW()
-            ) RETURNING id
-        """, contact.__dict__)
+    try:
+        with get_db_cursor() as cur:
+            cur.execute("""
+                INSERT INTO contacts (
+                    name, type, subtype, city, country, address, website, email,
+                    phone, preferred_language, status, fit_score, success_probability,
+                    best_visit_time, notes, created_at, updated_at
+                ) VALUES (
+                    %(name)s, %(type)s, %(subtype)s, %(city)s, %(country)s, %(address)s,
+                    %(website)s, %(email)s, %(phone)s, %(preferred_language)s, %(status)s,
+                    %(fit_score)s, %(success_probability)s, %(best_visit_time)s, %(notes)s,
+                    NOW(), NOW()
+                ) RETURNING id
+            """, contact.__dict__)
 
-        contact_id = cur.fetchone()['id']
-        logger.info(f"Created contact ID {contact_id}: {contact.name}")
+            contact_id = cur.fetchone()['id']
+    except errors.UniqueViolation:
+        # Migration 005's dedup index: name + city already taken by a live contact
+        raise DuplicateContactError(contact, _find_duplicate_contact_id(contact)) from None
+
+    logger.info(f"Created contact ID {contact_id}: {contact.name}")
+
+    # Emit event
+    bus.emit(EVENT_CONTACT_CREATED, {'contact_id': contact_id, 'contact': contact})
+
+    return contact_id
 
-        # Emit event
-        bus.emit(EVENT_CONTACT_CREATED, {'contact_id': contact_id, 'contact': contact})
 
-        return contact_id
+def _find_duplicate_contact_id(contact: Contact) -> Optional[int]:
+    """ID of the live contact holding contact's name + city in the dedup index."""
+    with get_db_cursor() as cur:
+        cur.execute("""
+            SELECT id FROM contacts
+            WHERE lower(btrim(name)) = lower(btrim(%(name)s))
+              AND lower(btrim(coalesce(city, ''))) = lower(btrim(coalesce(%(city)s, '')))
+              AND deleted_at IS NULL
+        """, {'name': contact.name, 'city': contact.city})
+
+        row = cur.fetchone()
+        return row['id'] if row else None
 
 
 def get_contact(contact_id: int) -> Optional[Contact]:
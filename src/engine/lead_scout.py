@@ -27,6 +27,7 @@ except ImportError:
     logger.warning("googlemaps library not installed. Google Maps API will not be available.")
 
 from src.engine import crm
+from src.engine.crm import DuplicateContactError
 from src.engine.ai_client import call_ai
 from src.models import Contact
 from src.bus.events import bus, EVENT_CONTACT_CREATED
@@ -324,18 +325,24 @@ REASONING: [1-2 sentences]"""
 # DEDUPLICATION & INSERTION
 # =============================================================================
 
+def _dedup_key(name: str, city: Optional[str]) -> tuple:
+    """Name + city as the contacts dedup index compares them: lower(btrim(...)), NULL city as ''."""
+    return (name.strip(' ').lower(), (city or '').strip(' ').lower())
+
+
 def check_duplicate(candidate: LeadCandidate) -> Optional[Contact]:
     """
     Check if candidate already exists in database.
-    Uses name+city matching (existing dedup logic).
+    Matches name + city the same way as the contacts dedup index (migration 005).
 
     Returns: Existing Contact if found, None otherwise
     """
-    existing = crm.search_contacts(name=candidate.name, city=candidate.city, limit=5)
+    key = _dedup_key(candidate.name, candidate.city)
+    existing = crm.search_contacts(name=key[0], city=key[1], limit=5)
 
     # Exact match check
     for contact in existing:
-        if contact.name.lower() == candidate.name.lower():
+        if _dedup_key(contact.name, contact.city) == key:
             return contact
 
     return None
@@ -393,7 +400,12 @@ def insert_lead(candidate: LeadCandidate, skip_if_exists: bool = True) -> Option
         notes=f"Auto-discovered via {candidate.source} on {datetime.now().date()}"
     )
 
-    contact_id = crm.create_contact(contact)
+    try:
+        contact_id = crm.create_contact(contact)
+    except DuplicateContactError as e:
+        # The dedup index caught a match check_duplicate's search missed
+        logger.debug(f"Duplicate on insert: {candidate.name} (ID: {e.contact_id})")
+        return None if skip_if_exists else e.contact_id
     logger.info(f"Created new lead: {candidate.name} (ID: {contact_id})")
 
     return contact_id
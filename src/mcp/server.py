@@ -62,6 +62,8 @@ def contact_create(
         )
         contact_id = crm.create_contact(contact)
         return json.dumps({"contact_id": contact_id, "name": name})
+    except crm.DuplicateContactError as e:
+        return json.dumps({"error": str(e), "existing_contact_id": e.contact_id})
     except Exception as e:
         logger.error(f"contact_create failed: {e}")
         return json.dumps({"error": str(e)})
@@ -0,0 +1,41 @@
+"""
+Shared fixtures for unit tests.
+
+- runner: one CliRunner for the session; invoke() isolates each call
+- mock_crm: autospec of src.engine.crm standing in for src.cli.main.crm
+- no_logging: prevents log file creation; test_cli.py applies it via pytestmark
+"""
+
+import pytest
+from unittest.mock import MagicMock, create_autospec
+from click.testing import CliRunner
+
+from src.engine import crm
+
+
+@pytest.fixture(scope="session")
+def runner():
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def _crm_spec():
+    """Autospec of src.engine.crm; slow to build, so built once and reset per test."""
+    return create_autospec(crm)
+
+
+@pytest.fixture
+def mock_crm(monkeypatch, _crm_spec):
+    """List-returning calls default to no results; tests override what they need."""
+    _crm_spec.reset_mock(return_value=True, side_effect=True)
+    for name in ('search_contacts', 'get_shows', 'get_overdue_contacts',
+                 'get_dormant_contacts', 'get_interactions'):
+        getattr(_crm_spec, name).return_value = []
+    monkeypatch.setattr("src.cli.main.crm", _crm_spec)
+    return _crm_spec
+
+
+@pytest.fixture
+def no_logging(monkeypatch):
+    """Prevent configure_logging from creating log files during tests."""
+    monkeypatch.setattr("src.cli.main.configure_logging", MagicMock())
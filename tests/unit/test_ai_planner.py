@@ -5,13 +5,21 @@ Mocking strategy:
 - src.engine.ai_planner.call_ai       → AI backend calls
 - src.engine.ai_planner.crm.*         → all crm module calls
 - src.engine.ai_planner.get_db_cursor → direct DB calls in score/suggest/batch
-- src.engine.ai_planner.bus.emit      → event emission
+- src.engine.ai_planner.bus.emit      → event emission (recorded in emitted)
+
+call_ai, crm.* and get_db_cursor are patched once for the whole module
+(ai_mocks); reset_mocks clears them and restores neutral return values before
+each test. get_db_cursor() yields the module's one FakeCursor (cursor), which
+reset_mocks also clears.
 """
 
+import re
 import pytest
-from contextlib import contextmanager
+from contextlib import ExitStack, nullcontext
+from dataclasses import replace
 from datetime import date
-from unittest.mock import MagicMock, patch, call
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import DEFAULT, MagicMock, patch, call
 
 from src.models import Contact, Interaction, Show
 from src.engine.ai_planner import (
@@ -29,120 +37,187 @@ from src.bus.events import EVENT_ANALYSIS_COMPLETE, EVENT_SUGGESTION_READY
 # Fixtures and helpers
 # ---------------------------------------------------------------------------
 
-SAMPLE_CONTACT = Contact(
-    id=1, name='Galerie Stern', type='gallery', subtype='contemporary',
-    city='Augsburg', country='DE', website='https://galerie-stern.de',
-    status='cold', preferred_language='de',
-)
+@pytest.fixture(scope='session')
+def sample_contact():
+    return Contact(
+        id=1, name='Galerie Stern', type='gallery', subtype='contemporary',
+        city='Augsburg', country='DE', website='https://galerie-stern.de',
+        status='cold', preferred_language='de',
+    )
 
-SAMPLE_INTERACTION = Interaction(
-    id=10, contact_id=1, interaction_date=date(2026, 1, 15),
-    method='email', direction='outbound', summary='Sent intro letter',
-    outcome='no_reply',
-)
 
-SAMPLE_SHOW = Show(
-    id=5, name='Frühjahrsausstellung', city='München',
-    date_start=date(2026, 4, 1), status='confirmed',
-)
+@pytest.fixture(scope='session')
+def sample_interaction():
+    return Interaction(
+        id=10, contact_id=1, interaction_date=date(2026, 1, 15),
+        method='email', direction='outbound', summary='Sent intro letter',
+        outcome='no_reply',
+    )
+
+
+@pytest.fixture(scope='session')
+def sample_show():
+    return Show(
+        id=5, name='Frühjahrsausstellung', city='München',
+        date_start=date(2026, 4, 1), status='confirmed',
+    )
+
+
+@pytest.fixture(scope='session')
+def nine_contacts():
+    return tuple(Contact(id=i, name=f'Gallery {i}') for i in range(1, 10))
 
-CONTACT_ROW = {
+
+# Read-only so a test or the code under test can't alter the row other tests share
+CONTACT_ROW = MappingProxyType({
     'id': 1, 'name': 'Galerie Stern', 'type': 'gallery', 'subtype': None,
     'city': 'Augsburg', 'country': 'DE', 'address': None,
     'website': None, 'email': None, 'phone': None,
     'preferred_language': 'de', 'status': 'cold',
     'fit_score': None, 'success_probability': None, 'best_visit_time': None,
     'notes': None, 'created_at': None, 'updated_at': None, 'deleted_at': None,
-}
+})
+
+
+class FakeCursor:
+    """Stand-in for a DB cursor: records execute() calls and returns canned rows."""
+    __slots__ = ('executed', 'rows', 'row', 'rowcount')
+
+    def __init__(self):
+        self.executed = []  # (query, params) per execute() call
+        self.reset()
 
+    def reset(self):
+        """Forget recorded queries and canned rows so the cursor can serve the next test."""
+        self.executed.clear()
+        self.row = None
+        self.rows = []
+        self.rowcount = 1
 
-def make_cursor(fetchone=None, fetchall=None, rowcount=1):
-    cur = MagicMock()
-    cur.fetchone.return_value = fetchone
-    cur.fetchall.return_value = fetchall if fetchall is not None else []
-    cur.rowcount = rowcount
-    return cur
+    def execute(self, query, params=None):
+        self.executed.append((query, params))
 
+    def fetchone(self):
+        return self.row
 
-def cursor_patch(cur):
-    @contextmanager
-    def _mock_ctx():
-        yield cur
-    return patch('src.engine.ai_planner.get_db_cursor', _mock_ctx)
+    def fetchall(self):
+        return self.rows
+
+
+CRM_FUNCTIONS = (
+    'get_contact', 'get_interactions', 'get_shows',
+    'get_overdue_contacts', 'get_dormant_contacts', 'update_contact',
+)
+
+
+@pytest.fixture(scope='module', autouse=True)
+def ai_mocks():
+    """Patch call_ai, the crm functions and get_db_cursor once for the whole module."""
+    with ExitStack() as stack:
+        mocks = SimpleNamespace(
+            call_ai=stack.enter_context(patch('src.engine.ai_planner.call_ai')),
+            get_db_cursor=stack.enter_context(patch('src.engine.ai_planner.get_db_cursor')),
+        )
+        # One patch.multiple for all crm functions; it yields {name: MagicMock}
+        crm_mocks = stack.enter_context(
+            patch.multiple('src.engine.ai_planner.crm', **dict.fromkeys(CRM_FUNCTIONS, DEFAULT))
+        )
+        vars(mocks).update(crm_mocks)
+        yield mocks
+
+
+@pytest.fixture(scope='module')
+def cursor():
+    """The one FakeCursor the patched get_db_cursor() yields; reset_mocks resets it per test."""
+    return FakeCursor()
+
+
+@pytest.fixture(autouse=True)
+def emitted(monkeypatch):
+    """Events passed to bus.emit, as (event_name, event_data); no handler runs."""
+    events = []
+    monkeypatch.setattr('src.engine.ai_planner.bus.emit',
+                        lambda event_name, event_data=None: events.append((event_name, event_data)))
+    return events
+
+
+@pytest.fixture(autouse=True)
+def reset_mocks(ai_mocks, cursor):
+    """Clear calls and configuration left by the previous test, then set neutral defaults."""
+    for mock in vars(ai_mocks).values():
+        mock.reset_mock(return_value=True, side_effect=True)
+    ai_mocks.get_contact.return_value = None
+    ai_mocks.update_contact.return_value = True
+    ai_mocks.call_ai.return_value = 'ok'
+    for name in ('get_interactions', 'get_shows', 'get_overdue_contacts', 'get_dormant_contacts'):
+        getattr(ai_mocks, name).return_value = []
+    cursor.reset()
+    ai_mocks.get_db_cursor.return_value = nullcontext(cursor)
 
 
 # ---------------------------------------------------------------------------
 # build_artist_context
 # ---------------------------------------------------------------------------
 
-def test_build_artist_context_returns_string():
-    result = build_artist_context()
-    assert isinstance(result, str)
-    assert len(result) > 0
+@pytest.fixture(scope='module')
+def artist_context():
+    """build_artist_context() is static text; build it once for all its tests."""
+    return build_artist_context()
 
 
-def test_build_artist_context_contains_artist_name():
-    result = build_artist_context()
-    assert 'Christopher Rehm' in result
+def test_build_artist_context_returns_string(artist_context):
+    assert isinstance(artist_context, str)
+    assert len(artist_context) > 0
 
 
-def test_build_artist_context_contains_location():
-    result = build_artist_context()
-    assert 'Bavaria' in result
+@pytest.mark.parametrize('expected', ['Christopher Rehm', 'Bavaria'], ids=['artist_name', 'location'])
+def test_build_artist_context_contains(artist_context, expected):
+    assert expected in artist_context
 
 
 # ---------------------------------------------------------------------------
 # build_context_for_contact
 # ---------------------------------------------------------------------------
 
-def test_build_context_contact_not_found_returns_empty():
-    with patch('src.engine.ai_planner.crm.get_contact', return_value=None), \
-         patch('src.engine.ai_planner.crm.get_interactions', return_value=[]), \
-         patch('src.engine.ai_planner.crm.get_shows', return_value=[]):
-        result = build_context_for_contact(999)
+def test_build_context_contact_not_found_returns_empty(ai_mocks):
+    result = build_context_for_contact(999)
     assert result == ''
 
 
-def test_build_context_includes_contact_name():
-    with patch('src.engine.ai_planner.crm.get_contact', return_value=SAMPLE_CONTACT), \
-         patch('src.engine.ai_planner.crm.get_interactions', return_value=[]), \
-         patch('src.engine.ai_planner.crm.get_shows', return_value=[]):
-        result = build_context_for_contact(1)
+@pytest.fixture
+def ctx_mocks(ai_mocks, sample_contact):
+    """ai_mocks with crm.get_contact finding the sample contact (no interactions or shows)."""
+    ai_mocks.get_contact.return_value = sample_contact
+    return ai_mocks
+
+
+def test_build_context_includes_contact_name(ctx_mocks):
+    result = build_context_for_contact(1)
     assert 'Galerie Stern' in result
 
 
-def test_build_context_no_interactions_message():
-    with patch('src.engine.ai_planner.crm.get_contact', return_value=SAMPLE_CONTACT), \
-         patch('src.engine.ai_planner.crm.get_interactions', return_value=[]), \
-         patch('src.engine.ai_planner.crm.get_shows', return_value=[]):
-        result = build_context_for_contact(1)
+def test_build_context_no_interactions_message(ctx_mocks):
+    result = build_context_for_contact(1)
     assert 'No previous interactions' in result
 
 
-def test_build_context_includes_interaction_history():
-    with patch('src.engine.ai_planner.crm.get_contact', return_value=SAMPLE_CONTACT), \
-         patch('src.engine.ai_planner.crm.get_interactions', return_value=[SAMPLE_INTERACTION]), \
-         patch('src.engine.ai_planner.crm.get_shows', return_value=[]):
-        result = build_context_for_contact(1)
+def test_build_context_includes_interaction_history(ctx_mocks, sample_interaction):
+    ctx_mocks.get_interactions.return_value = [sample_interaction]
+    result = build_context_for_contact(1)
     assert 'INTERACTION HISTORY' in result
     assert 'email' in result
 
 
-def test_build_context_includes_upcoming_shows():
-    with patch('src.engine.ai_planner.crm.get_contact', return_value=SAMPLE_CONTACT), \
-         patch('src.engine.ai_planner.crm.get_interactions', return_value=[]), \
-         patch('src.engine.ai_planner.crm.get_shows', return_value=[SAMPLE_SHOW]):
-        result = build_context_for_contact(1)
+def test_build_context_includes_upcoming_shows(ctx_mocks, sample_show):
+    ctx_mocks.get_shows.return_value = [sample_show]
+    result = build_context_for_contact(1)
     assert 'UPCOMING SHOWS' in result
     assert 'Frühjahrsausstellung' in result
 
 
-def test_build_context_includes_notes_when_present():
-    contact_with_notes = Contact(**{**SAMPLE_CONTACT.__dict__, 'notes': 'Very welcoming'})
-    with patch('src.engine.ai_planner.crm.get_contact', return_value=contact_with_notes), \
-         patch('src.engine.ai_planner.crm.get_interactions', return_value=[]), \
-         patch('src.engine.ai_planner.crm.get_shows', return_value=[]):
-        result = build_context_for_contact(1)
+def test_build_context_includes_notes_when_present(ctx_mocks, sample_contact):
+    ctx_mocks.get_contact.return_value = replace(sample_contact, notes='Very welcoming')
+    result = build_context_for_contact(1)
     assert 'Very welcoming' in result
 
 
@@ -150,40 +225,28 @@ def test_build_context_includes_notes_when_present():
 # generate_daily_brief
 # ---------------------------------------------------------------------------
 
-def test_generate_daily_brief_returns_ai_response():
-    with patch('src.engine.ai_planner.crm.get_overdue_contacts', return_value=[]), \
-         patch('src.engine.ai_planner.crm.get_dormant_contacts', return_value=[]), \
-         patch('src.engine.ai_planner.crm.get_shows', return_value=[]), \
-         patch('src.engine.ai_planner.call_ai', return_value='Contact Galerie X first'):
-        result = generate_daily_brief()
+def test_generate_daily_brief_returns_ai_response(ai_mocks):
+    ai_mocks.call_ai.return_value = 'Contact Galerie X first'
+    result = generate_daily_brief()
     assert result == 'Contact Galerie X first'
 
 
-def test_generate_daily_brief_calls_ai():
-    with patch('src.engine.ai_planner.crm.get_overdue_contacts', return_value=[SAMPLE_CONTACT]), \
-         patch('src.engine.ai_planner.crm.get_dormant_contacts', return_value=[]), \
-         patch('src.engine.ai_planner.crm.get_shows', return_value=[]), \
-         patch('src.engine.ai_planner.call_ai', return_value='ok') as mock_ai:
-        generate_daily_brief()
-    mock_ai.assert_called_once()
+def test_generate_daily_brief_calls_ai(ai_mocks, sample_contact):
+    ai_mocks.get_overdue_contacts.return_value = [sample_contact]
+    generate_daily_brief()
+    ai_mocks.call_ai.assert_called_once()
 
 
-def test_generate_daily_brief_uses_specified_model():
-    with patch('src.engine.ai_planner.crm.get_overdue_contacts', return_value=[]), \
-         patch('src.engine.ai_planner.crm.get_dormant_contacts', return_value=[]), \
-         patch('src.engine.ai_planner.crm.get_shows', return_value=[]), \
-         patch('src.engine.ai_planner.call_ai', return_value='ok') as mock_ai:
-        generate_daily_brief(model='deepseek-reasoner')
-    assert mock_ai.call_args[1]['model'] == 'deepseek-reasoner'
+def test_generate_daily_brief_uses_specified_model(ai_mocks):
+    generate_daily_brief(model='deepseek-reasoner')
+    assert ai_mocks.call_ai.call_args[1]['model'] == 'deepseek-reasoner'
 
 
-def test_generate_daily_brief_prompt_includes_contact_counts():
-    with patch('src.engine.ai_planner.crm.get_overdue_contacts', return_value=[SAMPLE_CONTACT, SAMPLE_CONTACT]), \
-         patch('src.engine.ai_planner.crm.get_dormant_contacts', return_value=[SAMPLE_CONTACT]), \
-         patch('src.engine.ai_planner.crm.get_shows', return_value=[]), \
-         patch('src.engine.ai_planner.call_ai', return_value='ok') as mock_ai:
-        generate_daily_brief()
-    prompt = mock_ai.call_args[0][0]
+def test_generate_daily_brief_prompt_includes_contact_counts(ai_mocks, sample_contact):
+    ai_mocks.get_overdue_contacts.return_value = [sample_contact, sample_contact]
+    ai_mocks.get_dormant_contacts.return_value = [sample_contact]
+    generate_daily_brief()
+    prompt = ai_mocks.call_ai.call_args[0][0]
     assert '2 contacts have overdue' in prompt
     assert '1 contacts have been dormant' in prompt
 
@@ -193,183 +256,115 @@ def test_generate_daily_brief_prompt_includes_contact_counts():
 # ---------------------------------------------------------------------------
 
 SCORE_RESPONSE = "SCORE: 75\nREASONING: Good gallery fit for watercolors\nAPPROACH: Send email intro"
+SCORE_RESPONSE_ABOVE_100 = "SCORE: 150\nREASONING: Great\nAPPROACH: Visit"
+SCORE_RESPONSE_BELOW_0 = "SCORE: -10\nREASONING: Poor\nAPPROACH: Skip"
+UNSTRUCTURED_RESPONSE = "This gallery is a good fit for the artist."
 
 
-def _patch_score_dependencies(ai_response=SCORE_RESPONSE, cur=None):
-    """Returns a dict of patches needed for score_contact_fit."""
-    if cur is None:
-        cur = make_cursor()
+@pytest.fixture
+def score_env(request, ai_mocks, cursor, sample_contact):
+    """
+    score_contact_fit dependencies, already patched: a known contact, its
+    context and a DB cursor. The AI response is SCORE_RESPONSE unless the
+    test parametrizes score_env indirectly with another one.
+    """
+    ai_mocks.get_contact.return_value = sample_contact
+    ai_mocks.call_ai.return_value = getattr(request, 'param', SCORE_RESPONSE)
+    with patch('src.engine.ai_planner.build_context_for_contact', return_value='some context'):
+        yield SimpleNamespace(cur=cursor, mocks=ai_mocks)
 
-    @contextmanager
-    def _mock_ctx():
-        yield cur
 
-    return [
-        patch('src.engine.ai_planner.crm.get_contact', return_value=SAMPLE_CONTACT),
-        patch('src.engine.ai_planner.build_context_for_contact', return_value='some context'),
-        patch('src.engine.ai_planner.call_ai', return_value=ai_response),
-        patch('src.engine.ai_planner.get_db_cursor', _mock_ctx),
-        patch('src.engine.ai_planner.crm.update_contact', return_value=True),
-        patch('src.engine.ai_planner.bus.emit'),
-    ]
+NOT_FOUND_RE = re.compile('not found')
 
 
-def test_score_contact_fit_raises_when_not_found():
-    with patch('src.engine.ai_planner.crm.get_contact', return_value=None):
-        with pytest.raises(ValueError, match='not found'):
-            score_contact_fit(999)
+def test_score_contact_fit_raises_when_not_found(ai_mocks):
+    with pytest.raises(ValueError, match=NOT_FOUND_RE):
+        score_contact_fit(999)
 
 
-def test_score_contact_fit_returns_dict_with_expected_keys():
-    patches = _patch_score_dependencies()
-    with patches[0], patches[1], patches[2], patches[3], patches[4], patches[5]:
-        result = score_contact_fit(1)
+def test_score_contact_fit_returns_dict_with_expected_keys(score_env):
+    result = score_contact_fit(1)
     assert 'fit_score' in result
     assert 'reasoning' in result
     assert 'suggested_approach' in result
     assert 'raw_response' in result
 
 
-def test_score_contact_fit_parses_score_correctly():
-    patches = _patch_score_dependencies()
-    with patches[0], patches[1], patches[2], patches[3], patches[4], patches[5]:
-        result = score_contact_fit(1)
-    assert result['fit_score'] == 75
-
-
-def test_score_contact_fit_parses_reasoning():
-    patches = _patch_score_dependencies()
-    with patches[0], patches[1], patches[2], patches[3], patches[4], patches[5]:
-        result = score_contact_fit(1)
-    assert 'watercolors' in result['reasoning']
-
-
-def test_score_contact_fit_parses_approach():
-    patches = _patch_score_dependencies()
-    with patches[0], patches[1], patches[2], patches[3], patches[4], patches[5]:
-        result = score_contact_fit(1)
-    assert 'email' in result['suggested_approach']
-
-
-def test_score_contact_fit_clamps_score_above_100():
-    patches = _patch_score_dependencies(ai_response='SCORE: 150\nREASONING: Great\nAPPROACH: Visit')
-    with patches[0], patches[1], patches[2], patches[3], patches[4], patches[5]:
-        result = score_contact_fit(1)
-    assert result['fit_score'] == 100
-
-
-def test_score_contact_fit_clamps_score_below_0():
-    patches = _patch_score_dependencies(ai_response='SCORE: -10\nREASONING: Poor\nAPPROACH: Skip')
-    with patches[0], patches[1], patches[2], patches[3], patches[4], patches[5]:
-        result = score_contact_fit(1)
-    assert result['fit_score'] == 0
-
-
-def test_score_contact_fit_falls_back_to_raw_when_no_reasoning():
-    raw = 'This gallery is a good fit for the artist.'
-    patches = _patch_score_dependencies(ai_response=raw)
-    with patches[0], patches[1], patches[2], patches[3], patches[4], patches[5]:
-        result = score_contact_fit(1)
-    assert result['reasoning'] == raw[:500]
+@pytest.mark.parametrize('score_env, field, expected', [
+    (SCORE_RESPONSE, 'fit_score', 75),
+    (SCORE_RESPONSE, 'reasoning', 'Good gallery fit for watercolors'),
+    (SCORE_RESPONSE, 'suggested_approach', 'Send email intro'),
+    (SCORE_RESPONSE_ABOVE_100, 'fit_score', 100),
+    (SCORE_RESPONSE_BELOW_0, 'fit_score', 0),
+    # No REASONING line: the raw response (first 500 chars) is used instead
+    (UNSTRUCTURED_RESPONSE, 'reasoning', UNSTRUCTURED_RESPONSE),
+], indirect=['score_env'], ids=['score', 'reasoning', 'approach', 'clamp_above_100', 'clamp_below_0', 'raw_fallback'])
+def test_score_contact_fit_parses_response(score_env, field, expected):
+    result = score_contact_fit(1)
+    assert result[field] == expected
 
 
-def test_score_contact_fit_emits_analysis_complete():
-    patches = _patch_score_dependencies()
-    with patches[0], patches[1], patches[2], patches[3], patches[4], \
-         patch('src.engine.ai_planner.bus.emit') as mock_emit:
-        score_contact_fit(1)
-    event_name = mock_emit.call_args[0][0]
+def test_score_contact_fit_emits_analysis_complete(score_env, emitted):
+    score_contact_fit(1)
+    event_name = emitted[-1][0]
     assert event_name == EVENT_ANALYSIS_COMPLETE
 
 
-def test_score_contact_fit_updates_contact_fit_score():
-    patches = _patch_score_dependencies()
-    with patches[0], patches[1], patches[2], patches[3], \
-         patch('src.engine.ai_planner.crm.update_contact') as mock_update, \
-         patches[5]:
-        score_contact_fit(1)
-    mock_update.assert_called_once_with(1, {'fit_score': 75})
+def test_score_contact_fit_updates_contact_fit_score(score_env):
+    score_contact_fit(1)
+    update = score_env.mocks.update_contact
+    assert update.call_count == 1
+    contact_id, updates = update.call_args.args
+    assert contact_id == 1 and updates['fit_score'] == 75
 
 
-def test_score_contact_fit_stores_in_db():
-    cur = make_cursor()
-    patches = _patch_score_dependencies(cur=cur)
-    with patches[0], patches[1], patches[2], patches[3], patches[4], patches[5]:
-        score_contact_fit(1)
-    cur.execute.assert_called_once()
-    sql = cur.execute.call_args[0][0]
+def test_score_contact_fit_stores_in_db(score_env):
+    score_contact_fit(1)
+    assert len(score_env.cur.executed) == 1
+    sql = score_env.cur.executed[0][0]
     assert 'INSERT INTO ai_analysis' in sql
 
 
-def test_score_contact_fit_uses_specified_model():
-    patches = _patch_score_dependencies()
-    with patches[0], patches[1], \
-         patch('src.engine.ai_planner.call_ai', return_value=SCORE_RESPONSE) as mock_ai, \
-         patches[3], patches[4], patches[5]:
-        score_contact_fit(1, model='claude')
-    assert mock_ai.call_args[1].get('model') == 'claude'
+def test_score_contact_fit_uses_specified_model(score_env):
+    score_contact_fit(1, model='claude')
+    assert score_env.mocks.call_ai.call_args[1].get('model') == 'claude'
 
 
 # ---------------------------------------------------------------------------
 # suggest_next_contacts
 # ---------------------------------------------------------------------------
 
-def test_suggest_next_contacts_returns_list():
-    cur = make_cursor(fetchall=[CONTACT_ROW])
-    with cursor_patch(cur), \
-         patch('src.engine.ai_planner.crm.get_overdue_contacts', return_value=[]), \
-         patch('src.engine.ai_planner.crm.get_shows', return_value=[]), \
-         patch('src.engine.ai_planner.call_ai', return_value='1. Contact X'), \
-         patch('src.engine.ai_planner.bus.emit'):
-        result = suggest_next_contacts(limit=5)
+def test_suggest_next_contacts_returns_list(ai_mocks, cursor):
+    cursor.rows = [CONTACT_ROW]
+    ai_mocks.call_ai.return_value = '1. Contact X'
+    result = suggest_next_contacts(limit=5)
     assert isinstance(result, list)
 
 
-def test_suggest_next_contacts_respects_limit():
-    contacts = [Contact(id=i, name=f'Gallery {i}') for i in range(1, 10)]
-    cur = make_cursor(fetchall=[])
-    with cursor_patch(cur), \
-         patch('src.engine.ai_planner.crm.get_overdue_contacts', return_value=contacts), \
-         patch('src.engine.ai_planner.crm.get_shows', return_value=[]), \
-         patch('src.engine.ai_planner.call_ai', return_value='ok'), \
-         patch('src.engine.ai_planner.bus.emit'):
-        result = suggest_next_contacts(limit=3)
+def test_suggest_next_contacts_respects_limit(ai_mocks, nine_contacts):
+    ai_mocks.get_overdue_contacts.return_value = list(nine_contacts)
+    result = suggest_next_contacts(limit=3)
     assert len(result) <= 3
 
 
-def test_suggest_next_contacts_deduplicates():
+def test_suggest_next_contacts_deduplicates(ai_mocks, cursor, sample_contact):
     # Same contact in overdue and high_fit — should appear only once
-    cur = make_cursor(fetchall=[CONTACT_ROW])  # high_fit returns same contact as overdue
-    with cursor_patch(cur), \
-         patch('src.engine.ai_planner.crm.get_overdue_contacts', return_value=[SAMPLE_CONTACT]), \
-         patch('src.engine.ai_planner.crm.get_shows', return_value=[]), \
-         patch('src.engine.ai_planner.call_ai', return_value='ok'), \
-         patch('src.engine.ai_planner.bus.emit'):
-        result = suggest_next_contacts(limit=5)
+    cursor.rows = [CONTACT_ROW]  # high_fit returns same contact as overdue
+    ai_mocks.get_overdue_contacts.return_value = [sample_contact]
+    result = suggest_next_contacts(limit=5)
     ids = [r['contact'].id for r in result]
     assert len(ids) == len(set(ids))
 
 
-def test_suggest_next_contacts_emits_event():
-    cur = make_cursor(fetchall=[])
-    with cursor_patch(cur), \
-         patch('src.engine.ai_planner.crm.get_overdue_contacts', return_value=[]), \
-         patch('src.engine.ai_planner.crm.get_shows', return_value=[]), \
-         patch('src.engine.ai_planner.call_ai', return_value='ok'), \
-         patch('src.engine.ai_planner.bus.emit') as mock_emit:
-        suggest_next_contacts()
-    event_name = mock_emit.call_args[0][0]
+def test_suggest_next_contacts_emits_event(emitted):
+    suggest_next_contacts()
+    event_name = emitted[-1][0]
     assert event_name == EVENT_SUGGESTION_READY
 
 
-def test_suggest_next_contacts_result_has_expected_keys():
-    cur = make_cursor(fetchall=[])
-    with cursor_patch(cur), \
-         patch('src.engine.ai_planner.crm.get_overdue_contacts', return_value=[SAMPLE_CONTACT]), \
-         patch('src.engine.ai_planner.crm.get_shows', return_value=[]), \
-         patch('src.engine.ai_planner.call_ai', return_value='ok'), \
-         patch('src.engine.ai_planner.bus.emit'):
-        result = suggest_next_contacts(limit=5)
+def test_suggest_next_contacts_result_has_expected_keys(ai_mocks, sample_contact):
+    ai_mocks.get_overdue_contacts.return_value = [sample_contact]
+    result = suggest_next_contacts(limit=5)
     assert all('contact' in r and 'reasoning' in r for r in result)
 
 
@@ -377,42 +372,23 @@ def test_suggest_next_contacts_result_has_expected_keys():
 # analyze_all_unscored_contacts
 # ---------------------------------------------------------------------------
 
-def test_analyze_all_unscored_returns_count():
-    cur = make_cursor(fetchall=[{'id': 1}, {'id': 2}])
-    with cursor_patch(cur), \
-         patch('src.engine.ai_planner.score_contact_fit'):
-        result = analyze_all_unscored_contacts(limit=10)
-    assert result == 2
-
-
-def test_analyze_all_unscored_returns_zero_when_none():
-    cur = make_cursor(fetchall=[])
-    with cursor_patch(cur), \
-         patch('src.engine.ai_planner.score_contact_fit') as mock_score:
-        result = analyze_all_unscored_contacts()
-    assert result == 0
-    mock_score.assert_not_called()
-
-
-def test_analyze_all_unscored_calls_score_for_each():
-    cur = make_cursor(fetchall=[{'id': 3}, {'id': 7}])
-    with cursor_patch(cur), \
-         patch('src.engine.ai_planner.score_contact_fit') as mock_score:
-        analyze_all_unscored_contacts()
-    assert mock_score.call_count == 2
-    mock_score.assert_any_call(3, model=None)
-    mock_score.assert_any_call(7, model=None)
-
-
-def test_analyze_all_unscored_continues_on_error():
-    cur = make_cursor(fetchall=[{'id': 1}, {'id': 2}])
-
-    def score_raises_on_first(contact_id, model=None):
-        if contact_id == 1:
-            raise RuntimeError('DeepSeek down')
-
-    with cursor_patch(cur), \
-         patch('src.engine.ai_planner.score_contact_fit', side_effect=score_raises_on_first):
-        result = analyze_all_unscored_contacts()
-    # Should complete both, returning 2 (count is based on IDs fetched, not successes)
-    assert result == 2
+@pytest.fixture
+def analyze_env(cursor, monkeypatch):
+    """Cursor for the unscored-contacts query plus a mocked score_contact_fit."""
+    score = MagicMock()
+    monkeypatch.setattr('src.engine.ai_planner.score_contact_fit', score)
+    return SimpleNamespace(cur=cursor, score=score)
+
+
+@pytest.mark.parametrize('rows, score_side_effect', [
+    ([{'id': 3}, {'id': 7}], None),
+    ([], None),
+    # A failing score is logged and skipped; the count is IDs fetched, not successes
+    ([{'id': 1}, {'id': 2}], [RuntimeError('DeepSeek down'), None]),
+], ids=['scores_each', 'none_unscored', 'continues_on_error'])
+def test_analyze_all_unscored_scores_each_contact(analyze_env, rows, score_side_effect):
+    analyze_env.cur.rows = rows
+    analyze_env.score.side_effect = score_side_effect
+    result = analyze_all_unscored_contacts(limit=10)
+    assert result == len(rows)
+    assert analyze_env.score.call_args_list == [call(row['id'], model=None) for row in rows]
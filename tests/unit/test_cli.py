@@ -2,60 +2,122 @@
 Unit tests for src/cli/main.py.
 
 Mocking strategy:
-  - patch src.cli.main.crm for all CRM-level calls
-  - patch src.cli.main.configure_logging (autouse) to prevent file I/O
+  - mock_crm fixture (conftest.py) replaces src.cli.main.crm for CRM-level calls
+  - no_logging fixture (conftest.py, applied by pytestmark) patches configure_logging to prevent file I/O
   - AI commands import their modules lazily inside the function body, so
-    we patch at src.engine.<module>.<function>
-  - Use click.testing.CliRunner to invoke commands end-to-end
+    the mock_brief/mock_score/... fixtures patch src.engine.<module>.<function>
+  - All patching goes through monkeypatch; no with patch(...) blocks
+  - Use the shared click.testing.CliRunner (runner, conftest.py) to invoke commands end-to-end
+
+The _prompt_date / _prompt_email helpers are tested in test_prompts.py.
 """
 
+import re
 import pytest
+from dataclasses import replace
 from datetime import date
-from unittest.mock import MagicMock, patch, call
-
-from click.testing import CliRunner
+from unittest.mock import MagicMock
 
-from src.cli.main import cli, _prompt_date, _prompt_email
+from src.cli.main import cli
+from src.engine.crm import DuplicateContactError
 from src.models import Contact, Interaction, Show
 
+# Every command runs the cli group callback, which calls configure_logging()
+pytestmark = pytest.mark.usefixtures("no_logging")
+
 
 # ---------------------------------------------------------------------------
 # Sample data
 # ---------------------------------------------------------------------------
 
-SAMPLE_CONTACT = Contact(
-    id=1, name='Galerie Stern', type='gallery', subtype='contemporary',
-    city='Augsburg', country='DE', email='info@galerie-stern.de',
-    preferred_language='de', status='cold',
-)
+# Built once per session; tests get a fresh copy (dataclasses.replace) so a
+# mutation in one test can't leak into another.
+
+@pytest.fixture(scope="session")
+def _base_contact():
+    return Contact(
+        id=1, name='Galerie Stern', type='gallery', subtype='contemporary',
+        city='Augsburg', country='DE', email='info@galerie-stern.de',
+        preferred_language='de', status='cold',
+    )
+
+
+@pytest.fixture(scope="session")
+def _base_interaction():
+    return Interaction(
+        id=10, contact_id=1, interaction_date=date(2026, 1, 15),
+        method='email', direction='outbound', summary='Sent intro letter',
+        outcome='no_reply', next_action=None, next_action_date=None,
+        ai_draft_used=False,
+    )
 
-SAMPLE_INTERACTION = Interaction(
-    id=10, contact_id=1, interaction_date=date(2026, 1, 15),
-    method='email', direction='outbound', summary='Sent intro letter',
-    outcome='no_reply', next_action=None, next_action_date=None,
-    ai_draft_used=False,
-)
 
-SAMPLE_SHOW = Show(
-    id=5, name='Fruhjahrsausstellung', city='Munchen',
-    date_start=date(2026, 4, 1), date_end=date(2026, 4, 30), status='confirmed',
-)
+@pytest.fixture(scope="session")
+def _base_show():
+    return Show(
+        id=5, name='Fruhjahrsausstellung', city='Munchen',
+        date_start=date(2026, 4, 1), date_end=date(2026, 4, 30), status='confirmed',
+    )
+
+
+@pytest.fixture
+def sample_contact(_base_contact):
+    return replace(_base_contact)
+
+
+@pytest.fixture
+def sample_interaction(_base_interaction):
+    return replace(_base_interaction)
+
+
+@pytest.fixture
+def sample_show(_base_show):
+    return replace(_base_show)
 
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
+def prompt_answers(*answers):
+    """stdin for an interactive command: one answer per prompt, '' accepts the default."""
+    return "\n".join(answers) + "\n"
+
+
+def _mock_engine(monkeypatch, target):
+    mock = MagicMock()
+    monkeypatch.setattr(target, mock)
+    return mock
+
+
 @pytest.fixture
-def runner():
-    return CliRunner()
+def mock_brief(monkeypatch):
+    return _mock_engine(monkeypatch, "src.engine.ai_planner.generate_daily_brief")
 
 
-@pytest.fixture(autouse=True)
-def no_logging():
-    """Prevent configure_logging from creating log files during tests."""
-    with patch("src.cli.main.configure_logging"):
-        yield
+@pytest.fixture
+def mock_score(monkeypatch):
+    return _mock_engine(monkeypatch, "src.engine.ai_planner.score_contact_fit")
+
+
+@pytest.fixture
+def mock_suggest(monkeypatch):
+    return _mock_engine(monkeypatch, "src.engine.ai_planner.suggest_next_contacts")
+
+
+@pytest.fixture
+def mock_draft(monkeypatch):
+    return _mock_engine(monkeypatch, "src.engine.email_composer.draft_first_contact_letter")
+
+
+@pytest.fixture
+def mock_followup(monkeypatch):
+    return _mock_engine(monkeypatch, "src.engine.email_composer.draft_follow_up_letter")
+
+
+@pytest.fixture
+def mock_scout(monkeypatch):
+    return _mock_engine(monkeypatch, "src.engine.lead_scout.scout_city")
 
 
 # ---------------------------------------------------------------------------
@@ -64,40 +126,34 @@ def no_logging():
 
 class TestContactsList:
 
-    def test_empty_result(self, runner):
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.search_contacts.return_value = []
-            result = runner.invoke(cli, ["contacts", "list"])
-        assert result.exit_code == 0
+    def test_empty_result(self, runner, mock_crm):
+        mock_crm.search_contacts.return_value = []
+        result = runner.invoke(cli, ["contacts", "list"])
+        assert result.exit_code == 0, result.output
         assert "No contacts found" in result.output
 
-    def test_lists_contacts(self, runner):
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.search_contacts.return_value = [SAMPLE_CONTACT]
-            result = runner.invoke(cli, ["contacts", "list"])
-        assert result.exit_code == 0
+    def test_lists_contacts(self, runner, mock_crm, sample_contact):
+        mock_crm.search_contacts.return_value = [sample_contact]
+        result = runner.invoke(cli, ["contacts", "list"])
+        assert result.exit_code == 0, result.output
         assert "Galerie Stern" in result.output
         assert "Augsburg" in result.output
         assert "gallery" in result.output
 
-    def test_passes_filters_to_crm(self, runner):
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.search_contacts.return_value = []
-            runner.invoke(cli, [
-                "contacts", "list",
-                "--type", "gallery",
-                "--status", "cold",
-                "--city", "Augsburg",
-                "--limit", "10",
-            ])
+    def test_passes_filters_to_crm(self, runner, mock_crm):
+        runner.invoke(cli, [
+            "contacts", "list",
+            "--type", "gallery",
+            "--status", "cold",
+            "--city", "Augsburg",
+            "--limit", "10",
+        ])
         mock_crm.search_contacts.assert_called_once_with(
             type="gallery", status="cold", city="Augsburg", limit=10
         )
 
-    def test_default_limit_is_500(self, runner):
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.search_contacts.return_value = []
-            runner.invoke(cli, ["contacts", "list"])
+    def test_default_limit_is_500(self, runner, mock_crm):
+        runner.invoke(cli, ["contacts", "list"])
         _, kwargs = mock_crm.search_contacts.call_args
         assert kwargs["limit"] == 500
 
@@ -106,50 +162,45 @@ class TestContactsList:
 # contacts show
 # ---------------------------------------------------------------------------
 
+# Header, details block, then the empty history, matched in one pass in output order
+CONTACT_DETAILS_RE = re.compile(r"Galerie Stern.*Augsburg.*No interactions yet", re.S)
+
+
 class TestContactsShow:
 
-    def test_not_found(self, runner):
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.get_contact.return_value = None
-            result = runner.invoke(cli, ["contacts", "show", "99"])
-        assert result.exit_code == 0
+    def test_not_found(self, runner, mock_crm):
+        mock_crm.get_contact.return_value = None
+        result = runner.invoke(cli, ["contacts", "show", "99"])
+        assert result.exit_code == 0, result.output
         assert "not found" in result.output
 
-    def test_shows_contact_details(self, runner):
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.get_contact.return_value = SAMPLE_CONTACT
-            mock_crm.get_interactions.return_value = []
-            result = runner.invoke(cli, ["contacts", "show", "1"])
-        assert result.exit_code == 0
-        assert "Galerie Stern" in result.output
-        assert "Augsburg" in result.output
-        assert "No interactions yet" in result.output
+    def test_shows_contact_details(self, runner, mock_crm, sample_contact):
+        mock_crm.get_contact.return_value = sample_contact
+        result = runner.invoke(cli, ["contacts", "show", "1"])
+        assert result.exit_code == 0, result.output
+        assert CONTACT_DETAILS_RE.search(result.output), result.output
 
-    def test_shows_interactions(self, runner):
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.get_contact.return_value = SAMPLE_CONTACT
-            mock_crm.get_interactions.return_value = [SAMPLE_INTERACTION]
-            result = runner.invoke(cli, ["contacts", "show", "1"])
+    def test_shows_interactions(self, runner, mock_crm, sample_contact, sample_interaction):
+        mock_crm.get_contact.return_value = sample_contact
+        mock_crm.get_interactions.return_value = [sample_interaction]
+        result = runner.invoke(cli, ["contacts", "show", "1"])
         assert "Sent intro letter" in result.output
 
-    def test_interaction_with_next_action(self, runner):
+    def test_interaction_with_next_action(self, runner, mock_crm, sample_contact):
         interaction = Interaction(
             id=11, contact_id=1, interaction_date=date(2026, 1, 15),
             method='email', direction='outbound', summary='Follow-up sent',
             outcome='interested', next_action='Call back', next_action_date=date(2026, 2, 1),
         )
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.get_contact.return_value = SAMPLE_CONTACT
-            mock_crm.get_interactions.return_value = [interaction]
-            result = runner.invoke(cli, ["contacts", "show", "1"])
+        mock_crm.get_contact.return_value = sample_contact
+        mock_crm.get_interactions.return_value = [interaction]
+        result = runner.invoke(cli, ["contacts", "show", "1"])
         assert "Call back" in result.output
 
-    def test_contact_with_notes(self, runner):
+    def test_contact_with_notes(self, runner, mock_crm):
         contact = Contact(id=1, name='Test', status='cold', preferred_language='de', notes='Great gallery')
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.get_contact.return_value = contact
-            mock_crm.get_interactions.return_value = []
-            result = runner.invoke(cli, ["contacts", "show", "1"])
+        mock_crm.get_contact.return_value = contact
+        result = runner.invoke(cli, ["contacts", "show", "1"])
         assert "Great gallery" in result.output
 
 
@@ -159,36 +210,32 @@ class TestContactsShow:
 
 class TestContactsEdit:
 
-    def test_no_options_prints_error(self, runner):
-        with patch("src.cli.main.crm") as mock_crm:
-            result = runner.invoke(cli, ["contacts", "edit", "1"])
-        assert result.exit_code == 0
+    def test_no_options_prints_error(self, runner, mock_crm):
+        result = runner.invoke(cli, ["contacts", "edit", "1"])
+        assert result.exit_code == 0, result.output
         assert "No updates specified" in result.output
         mock_crm.update_contact.assert_not_called()
 
-    def test_updates_status(self, runner):
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.update_contact.return_value = True
-            result = runner.invoke(cli, ["contacts", "edit", "1", "--status", "contacted"])
-        assert result.exit_code == 0
+    def test_updates_status(self, runner, mock_crm):
+        mock_crm.update_contact.return_value = True
+        result = runner.invoke(cli, ["contacts", "edit", "1", "--status", "contacted"])
+        assert result.exit_code == 0, result.output
         assert "Updated" in result.output
         mock_crm.update_contact.assert_called_once_with(1, {"status": "contacted"})
 
-    def test_not_found(self, runner):
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.update_contact.return_value = False
-            result = runner.invoke(cli, ["contacts", "edit", "1", "--status", "contacted"])
+    def test_not_found(self, runner, mock_crm):
+        mock_crm.update_contact.return_value = False
+        result = runner.invoke(cli, ["contacts", "edit", "1", "--status", "contacted"])
         assert "not found" in result.output
 
-    def test_multiple_fields(self, runner):
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.update_contact.return_value = True
-            runner.invoke(cli, [
-                "contacts", "edit", "1",
-                "--email", "new@test.de",
-                "--website", "https://test.de",
-                "--notes", "Updated notes",
-            ])
+    def test_multiple_fields(self, runner, mock_crm):
+        mock_crm.update_contact.return_value = True
+        runner.invoke(cli, [
+            "contacts", "edit", "1",
+            "--email", "new@test.de",
+            "--website", "https://test.de",
+            "--notes", "Updated notes",
+        ])
         mock_crm.update_contact.assert_called_once_with(1, {
             "email": "new@test.de",
             "website": "https://test.de",
@@ -202,25 +249,31 @@ class TestContactsEdit:
 
 class TestContactsAdd:
 
-    def test_creates_contact(self, runner):
-        # Prompts: name, type, subtype, city, country, website, email, language, notes
-        inputs = "Neue Galerie\n\n\nMunchen\n\n\n\n\n\n"
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.create_contact.return_value = 42
-            result = runner.invoke(cli, ["contacts", "add"], input=inputs)
-        assert result.exit_code == 0
+    # Prompts: name, type, subtype, city, country, website, email, language, notes
+    NEUE_GALERIE = prompt_answers("Neue Galerie", "", "", "Munchen", "", "", "", "", "")
+    NAME_ONLY = prompt_answers("My Gallery", "", "", "", "", "", "", "", "")
+
+    def test_creates_contact(self, runner, mock_crm):
+        mock_crm.create_contact.return_value = 42
+        result = runner.invoke(cli, ["contacts", "add"], input=self.NEUE_GALERIE)
+        assert result.exit_code == 0, result.output
         assert "42" in result.output
         assert "Neue Galerie" in result.output
 
-    def test_create_contact_called_with_correct_name(self, runner):
-        inputs = "My Gallery\n\n\n\n\n\n\n\n\n"
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.create_contact.return_value = 1
-            runner.invoke(cli, ["contacts", "add"], input=inputs)
+    def test_create_contact_called_with_correct_name(self, runner, mock_crm):
+        mock_crm.create_contact.return_value = 1
+        runner.invoke(cli, ["contacts", "add"], input=self.NAME_ONLY)
         contact_arg = mock_crm.create_contact.call_args[0][0]
         assert contact_arg.name == "My Gallery"
         assert contact_arg.status == "cold"
 
+    def test_duplicate_reports_existing_contact(self, runner, mock_crm):
+        mock_crm.create_contact.side_effect = DuplicateContactError(Contact(name="Neue Galerie"), 7)
+        result = runner.invoke(cli, ["contacts", "add"], input=self.NEUE_GALERIE)
+        assert result.exit_code == 0, result.output
+        assert "already exists (ID: 7)" in result.output
+        assert "Created contact" not in result.output
+
 
 # ---------------------------------------------------------------------------
 # contacts log (interactive)
@@ -228,31 +281,29 @@ class TestContactsAdd:
 
 class TestContactsLog:
 
-    def test_contact_not_found(self, runner):
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.get_contact.return_value = None
-            result = runner.invoke(cli, ["contacts", "log", "99"])
-        assert result.exit_code == 0
+    # Prompts: date (accept default), method, direction, summary, outcome, next_action,
+    # then days_ahead only when a next action is given
+    NO_NEXT_ACTION = prompt_answers("", "", "", "Sent intro", "", "")
+    WITH_NEXT_ACTION = prompt_answers("", "", "", "Sent intro", "", "Call back", "30")
+
+    def test_contact_not_found(self, runner, mock_crm):
+        mock_crm.get_contact.return_value = None
+        result = runner.invoke(cli, ["contacts", "log", "99"])
+        assert result.exit_code == 0, result.output
         assert "not found" in result.output
 
-    def test_logs_interaction(self, runner):
-        # Prompts: date (accept default), method, direction, summary, outcome, next_action (empty)
-        inputs = "\n\n\nSent intro\n\n\n"
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.get_contact.return_value = SAMPLE_CONTACT
-            mock_crm.log_interaction.return_value = 10
-            result = runner.invoke(cli, ["contacts", "log", "1"], input=inputs)
-        assert result.exit_code == 0
+    def test_logs_interaction(self, runner, mock_crm, sample_contact):
+        mock_crm.get_contact.return_value = sample_contact
+        mock_crm.log_interaction.return_value = 10
+        result = runner.invoke(cli, ["contacts", "log", "1"], input=self.NO_NEXT_ACTION)
+        assert result.exit_code == 0, result.output
         assert "10" in result.output
 
-    def test_interaction_with_next_action(self, runner):
-        # Prompts: date, method, direction, summary, outcome, next_action, days_ahead
-        inputs = "\n\n\nSent intro\n\nCall back\n30\n"
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.get_contact.return_value = SAMPLE_CONTACT
-            mock_crm.log_interaction.return_value = 11
-            result = runner.invoke(cli, ["contacts", "log", "1"], input=inputs)
-        assert result.exit_code == 0
+    def test_interaction_with_next_action(self, runner, mock_crm, sample_contact):
+        mock_crm.get_contact.return_value = sample_contact
+        mock_crm.log_interaction.return_value = 11
+        result = runner.invoke(cli, ["contacts", "log", "1"], input=self.WITH_NEXT_ACTION)
+        assert result.exit_code == 0, result.output
         interaction_arg = mock_crm.log_interaction.call_args[0][0]
         assert interaction_arg.next_action == "Call back"
 
@@ -261,47 +312,52 @@ class TestContactsLog:
 # shows list
 # ---------------------------------------------------------------------------
 
+@pytest.fixture
+def frozen_today(monkeypatch):
+    """Pin date.today() inside src.cli.main; the rest of date is untouched."""
+    today = date(2026, 3, 15)
+
+    class FrozenDate(date):
+        @classmethod
+        def today(cls):
+            return today
+
+    monkeypatch.setattr("src.cli.main.date", FrozenDate)
+    return today
+
+
 class TestShowsList:
 
-    def test_empty_result(self, runner):
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.get_shows.return_value = []
-            result = runner.invoke(cli, ["shows", "list"])
-        assert result.exit_code == 0
+    def test_empty_result(self, runner, mock_crm):
+        mock_crm.get_shows.return_value = []
+        result = runner.invoke(cli, ["shows", "list"])
+        assert result.exit_code == 0, result.output
         assert "No shows found" in result.output
 
-    def test_lists_shows(self, runner):
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.get_shows.return_value = [SAMPLE_SHOW]
-            result = runner.invoke(cli, ["shows", "list"])
-        assert result.exit_code == 0
+    def test_lists_shows(self, runner, mock_crm, sample_show):
+        mock_crm.get_shows.return_value = [sample_show]
+        result = runner.invoke(cli, ["shows", "list"])
+        assert result.exit_code == 0, result.output
         assert "Fruhjahrsausstellung" in result.output
 
-    def test_show_without_date(self, runner):
+    def test_show_without_date(self, runner, mock_crm):
         show = Show(id=6, name='Untitled Show', status='possible')
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.get_shows.return_value = [show]
-            result = runner.invoke(cli, ["shows", "list"])
+        mock_crm.get_shows.return_value = [show]
+        result = runner.invoke(cli, ["shows", "list"])
         assert "no date" in result.output
 
-    def test_upcoming_flag_filters_by_today(self, runner):
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.get_shows.return_value = []
-            runner.invoke(cli, ["shows", "list", "--upcoming"])
+    def test_upcoming_flag_filters_by_today(self, runner, mock_crm, frozen_today):
+        runner.invoke(cli, ["shows", "list", "--upcoming"])
         _, kwargs = mock_crm.get_shows.call_args
-        assert kwargs["date_from"] == date.today()
+        assert kwargs["date_from"] == frozen_today
 
-    def test_no_upcoming_flag_passes_none(self, runner):
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.get_shows.return_value = []
-            runner.invoke(cli, ["shows", "list"])
+    def test_no_upcoming_flag_passes_none(self, runner, mock_crm):
+        runner.invoke(cli, ["shows", "list"])
         _, kwargs = mock_crm.get_shows.call_args
         assert kwargs["date_from"] is None
 
-    def test_status_filter_passed_through(self, runner):
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.get_shows.return_value = []
-            runner.invoke(cli, ["shows", "list", "--status", "confirmed"])
+    def test_status_filter_passed_through(self, runner, mock_crm):
+        runner.invoke(cli, ["shows", "list", "--status", "confirmed"])
         _, kwargs = mock_crm.get_shows.call_args
         assert kwargs["status"] == "confirmed"
 
@@ -312,21 +368,20 @@ class TestShowsList:
 
 class TestShowsAdd:
 
-    def test_creates_show(self, runner):
-        # Prompts: name, city, start_date, end_date, theme, status, notes
-        inputs = "Fruhjahrsschau\nMunchen\n\n\n\n\n\n"
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.create_show.return_value = 5
-            result = runner.invoke(cli, ["shows", "add"], input=inputs)
-        assert result.exit_code == 0
+    # Prompts: name, city, start_date, end_date, theme, status, notes
+    FRUHJAHRSSCHAU = prompt_answers("Fruhjahrsschau", "Munchen", "", "", "", "", "")
+    NAME_ONLY = prompt_answers("My Show", "", "", "", "", "", "")
+
+    def test_creates_show(self, runner, mock_crm):
+        mock_crm.create_show.return_value = 5
+        result = runner.invoke(cli, ["shows", "add"], input=self.FRUHJAHRSSCHAU)
+        assert result.exit_code == 0, result.output
         assert "5" in result.output
         assert "Fruhjahrsschau" in result.output
 
-    def test_show_created_with_correct_name(self, runner):
-        inputs = "My Show\n\n\n\n\n\n\n"
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.create_show.return_value = 1
-            runner.invoke(cli, ["shows", "add"], input=inputs)
+    def test_show_created_with_correct_name(self, runner, mock_crm):
+        mock_crm.create_show.return_value = 1
+        runner.invoke(cli, ["shows", "add"], input=self.NAME_ONLY)
         show_arg = mock_crm.create_show.call_args[0][0]
         assert show_arg.name == "My Show"
 
@@ -337,18 +392,16 @@ class TestShowsAdd:
 
 class TestOverdue:
 
-    def test_no_overdue(self, runner):
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.get_overdue_contacts.return_value = []
-            result = runner.invoke(cli, ["overdue"])
-        assert result.exit_code == 0
+    def test_no_overdue(self, runner, mock_crm):
+        mock_crm.get_overdue_contacts.return_value = []
+        result = runner.invoke(cli, ["overdue"])
+        assert result.exit_code == 0, result.output
         assert "all caught up" in result.output
 
-    def test_lists_overdue_contacts(self, runner):
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.get_overdue_contacts.return_value = [SAMPLE_CONTACT]
-            result = runner.invoke(cli, ["overdue"])
-        assert result.exit_code == 0
+    def test_lists_overdue_contacts(self, runner, mock_crm, sample_contact):
+        mock_crm.get_overdue_contacts.return_value = [sample_contact]
+        result = runner.invoke(cli, ["overdue"])
+        assert result.exit_code == 0, result.output
         assert "Galerie Stern" in result.output
         assert "1 contacts" in result.output
 
@@ -357,40 +410,36 @@ class TestOverdue:
 # dormant
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="module")
+def dormant_25():
+    return tuple(
+        Contact(id=i, name=f"Gallery {i}", type='gallery', status='cold', preferred_language='de')
+        for i in range(25)
+    )
+
+
 class TestDormant:
 
-    def test_no_dormant(self, runner):
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.get_dormant_contacts.return_value = []
-            result = runner.invoke(cli, ["dormant"])
-        assert result.exit_code == 0
+    def test_no_dormant(self, runner, mock_crm):
+        mock_crm.get_dormant_contacts.return_value = []
+        result = runner.invoke(cli, ["dormant"])
+        assert result.exit_code == 0, result.output
         assert "No dormant contacts" in result.output
 
-    def test_lists_dormant_contacts(self, runner):
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.get_dormant_contacts.return_value = [SAMPLE_CONTACT]
-            result = runner.invoke(cli, ["dormant"])
-        assert result.exit_code == 0
+    def test_lists_dormant_contacts(self, runner, mock_crm, sample_contact):
+        mock_crm.get_dormant_contacts.return_value = [sample_contact]
+        result = runner.invoke(cli, ["dormant"])
+        assert result.exit_code == 0, result.output
         assert "Galerie Stern" in result.output
 
-    def test_truncates_at_20_with_more_message(self, runner):
-        contacts = [
-            Contact(id=i, name=f"Gallery {i}", type='gallery', status='cold', preferred_language='de')
-            for i in range(25)
-        ]
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.get_dormant_contacts.return_value = contacts
-            result = runner.invoke(cli, ["dormant"])
+    def test_truncates_at_20_with_more_message(self, runner, mock_crm, dormant_25):
+        mock_crm.get_dormant_contacts.return_value = list(dormant_25)
+        result = runner.invoke(cli, ["dormant"])
         assert "and 5 more" in result.output
 
-    def test_exactly_20_no_more_message(self, runner):
-        contacts = [
-            Contact(id=i, name=f"Gallery {i}", type='gallery', status='cold', preferred_language='de')
-            for i in range(20)
-        ]
-        with patch("src.cli.main.crm") as mock_crm:
-            mock_crm.get_dormant_contacts.return_value = contacts
-            result = runner.invoke(cli, ["dormant"])
+    def test_exactly_20_no_more_message(self, runner, mock_crm, dormant_25):
+        mock_crm.get_dormant_contacts.return_value = list(dormant_25[:20])
+        result = runner.invoke(cli, ["dormant"])
         assert "more" not in result.output
 
 
@@ -400,20 +449,12 @@ class TestDormant:
 
 class TestBrief:
 
-    def test_success(self, runner):
-        with patch("src.engine.ai_planner.generate_daily_brief") as mock_brief:
-            mock_brief.return_value = "Contact Galerie Stern this week."
-            result = runner.invoke(cli, ["brief"])
-        assert result.exit_code == 0
+    def test_success(self, runner, mock_brief):
+        mock_brief.return_value = "Contact Galerie Stern this week."
+        result = runner.invoke(cli, ["brief"])
+        assert result.exit_code == 0, result.output
         assert "Contact Galerie Stern this week." in result.output
 
-    def test_exception_handled_gracefully(self, runner):
-        with patch("src.engine.ai_planner.generate_daily_brief") as mock_brief:
-            mock_brief.side_effect = Exception("Ollama not running")
-            result = runner.invoke(cli, ["brief"])
-        assert result.exit_code == 0
-        assert "Error" in result.output
-
 
 # ---------------------------------------------------------------------------
 # score
@@ -421,33 +462,24 @@ class TestBrief:
 
 class TestScore:
 
-    def test_success(self, runner):
+    def test_success(self, runner, mock_score):
         mock_result = {
             "fit_score": 78,
             "reasoning": "Good match for abstract work.",
             "suggested_approach": "Send email first.",
         }
-        with patch("src.engine.ai_planner.score_contact_fit") as mock_score:
-            mock_score.return_value = mock_result
-            result = runner.invoke(cli, ["score", "1"])
-        assert result.exit_code == 0
+        mock_score.return_value = mock_result
+        result = runner.invoke(cli, ["score", "1"])
+        assert result.exit_code == 0, result.output
         assert "78" in result.output
         assert "Good match" in result.output
 
-    def test_passes_contact_id(self, runner):
+    def test_passes_contact_id(self, runner, mock_score):
         mock_result = {"fit_score": 50, "reasoning": "OK", "suggested_approach": "Try"}
-        with patch("src.engine.ai_planner.score_contact_fit") as mock_score:
-            mock_score.return_value = mock_result
-            runner.invoke(cli, ["score", "42"])
+        mock_score.return_value = mock_result
+        runner.invoke(cli, ["score", "42"])
         mock_score.assert_called_once_with(42, model='deepseek-chat')
 
-    def test_exception_handled_gracefully(self, runner):
-        with patch("src.engine.ai_planner.score_contact_fit") as mock_score:
-            mock_score.side_effect = Exception("AI error")
-            result = runner.invoke(cli, ["score", "1"])
-        assert result.exit_code == 0
-        assert "Error" in result.output
-
 
 # ---------------------------------------------------------------------------
 # suggest
@@ -455,33 +487,23 @@ class TestScore:
 
 class TestSuggest:
 
-    def test_success(self, runner):
-        suggestions = [{"contact": SAMPLE_CONTACT}]
-        with patch("src.engine.ai_planner.suggest_next_contacts") as mock_suggest:
-            mock_suggest.return_value = suggestions
-            result = runner.invoke(cli, ["suggest"])
-        assert result.exit_code == 0
+    def test_success(self, runner, mock_suggest, sample_contact):
+        suggestions = [{"contact": sample_contact}]
+        mock_suggest.return_value = suggestions
+        result = runner.invoke(cli, ["suggest"])
+        assert result.exit_code == 0, result.output
         assert "Galerie Stern" in result.output
 
-    def test_default_limit_is_5(self, runner):
-        with patch("src.engine.ai_planner.suggest_next_contacts") as mock_suggest:
-            mock_suggest.return_value = []
-            runner.invoke(cli, ["suggest"])
+    def test_default_limit_is_5(self, runner, mock_suggest):
+        mock_suggest.return_value = []
+        runner.invoke(cli, ["suggest"])
         mock_suggest.assert_called_once_with(limit=5, model='deepseek-chat')
 
-    def test_custom_limit(self, runner):
-        with patch("src.engine.ai_planner.suggest_next_contacts") as mock_suggest:
-            mock_suggest.return_value = []
-            runner.invoke(cli, ["suggest", "--limit", "10"])
+    def test_custom_limit(self, runner, mock_suggest):
+        mock_suggest.return_value = []
+        runner.invoke(cli, ["suggest", "--limit", "10"])
         mock_suggest.assert_called_once_with(limit=10, model='deepseek-chat')
 
-    def test_exception_handled_gracefully(self, runner):
-        with patch("src.engine.ai_planner.suggest_next_contacts") as mock_suggest:
-            mock_suggest.side_effect = Exception("AI unavailable")
-            result = runner.invoke(cli, ["suggest"])
-        assert result.exit_code == 0
-        assert "Error" in result.output
-
 
 # ---------------------------------------------------------------------------
 # draft
@@ -497,37 +519,20 @@ class TestDraft:
         "draft_path": "/tmp/draft_001.txt",
     }
 
-    def test_success(self, runner):
-        with patch("src.engine.email_composer.draft_first_contact_letter") as mock_draft:
-            mock_draft.return_value = self.DRAFT_RESULT
-            result = runner.invoke(cli, ["draft", "1"])
-        assert result.exit_code == 0
+    def test_success(self, runner, mock_draft):
+        mock_draft.return_value = self.DRAFT_RESULT
+        result = runner.invoke(cli, ["draft", "1"])
+        assert result.exit_code == 0, result.output
         assert "Galerie Stern" in result.output
         assert "Vorstellung" in result.output
 
-    def test_passes_contact_id_and_options(self, runner):
-        with patch("src.engine.email_composer.draft_first_contact_letter") as mock_draft:
-            mock_draft.return_value = self.DRAFT_RESULT
-            runner.invoke(cli, ["draft", "42", "--language", "en", "--no-portfolio"])
+    def test_passes_contact_id_and_options(self, runner, mock_draft):
+        mock_draft.return_value = self.DRAFT_RESULT
+        runner.invoke(cli, ["draft", "42", "--language", "en", "--no-portfolio"])
         mock_draft.assert_called_once_with(
             contact_id=42, language="en", include_portfolio_link=False, model='deepseek-reasoner'
         )
 
-    def test_value_error_handled(self, runner):
-        with patch("src.engine.email_composer.draft_first_contact_letter") as mock_draft:
-            mock_draft.side_effect = ValueError("Contact not found")
-            result = runner.invoke(cli, ["draft", "1"])
-        assert result.exit_code == 0
-        assert "Error" in result.output
-
-    def test_runtime_error_handled(self, runner):
-        with patch("src.engine.email_composer.draft_first_contact_letter") as mock_draft:
-            mock_draft.side_effect = RuntimeError("API key missing")
-            result = runner.invoke(cli, ["draft", "1"])
-        assert result.exit_code == 0
-        assert "API Error" in result.output
-        assert "ANTHROPIC_API_KEY" in result.output
-
 
 # ---------------------------------------------------------------------------
 # followup
@@ -543,34 +548,54 @@ class TestFollowup:
         "draft_path": "/tmp/followup_001.txt",
     }
 
-    def test_success(self, runner):
-        with patch("src.engine.email_composer.draft_follow_up_letter") as mock_followup:
-            mock_followup.return_value = self.FOLLOWUP_RESULT
-            result = runner.invoke(cli, ["followup", "1"], input="Hatte gutes Gesprach\n")
-        assert result.exit_code == 0
+    def test_success(self, runner, mock_followup):
+        mock_followup.return_value = self.FOLLOWUP_RESULT
+        result = runner.invoke(cli, ["followup", "1"], input="Hatte gutes Gesprach\n")
+        assert result.exit_code == 0, result.output
         assert "Galerie Stern" in result.output
         assert "Nachfrage" in result.output
 
-    def test_passes_summary_to_composer(self, runner):
-        with patch("src.engine.email_composer.draft_follow_up_letter") as mock_followup:
-            mock_followup.return_value = self.FOLLOWUP_RESULT
-            runner.invoke(cli, ["followup", "1"], input="My summary\n")
+    def test_passes_summary_to_composer(self, runner, mock_followup):
+        mock_followup.return_value = self.FOLLOWUP_RESULT
+        runner.invoke(cli, ["followup", "1"], input="My summary\n")
         _, kwargs = mock_followup.call_args
         assert kwargs["previous_interaction_summary"] == "My summary"
 
-    def test_value_error_handled(self, runner):
-        with patch("src.engine.email_composer.draft_follow_up_letter") as mock_followup:
-            mock_followup.side_effect = ValueError("No interactions found")
-            result = runner.invoke(cli, ["followup", "1"], input="summary\n")
-        assert result.exit_code == 0
-        assert "Error" in result.output
 
-    def test_runtime_error_handled(self, runner):
-        with patch("src.engine.email_composer.draft_follow_up_letter") as mock_followup:
-            mock_followup.side_effect = RuntimeError("API error")
-            result = runner.invoke(cli, ["followup", "1"], input="summary\n")
-        assert result.exit_code == 0
-        assert "API Error" in result.output
+# ---------------------------------------------------------------------------
+# AI command error handling
+# ---------------------------------------------------------------------------
+
+# (engine function, argv, stdin, exception raised, expected output)
+EXCEPTION_CASES = [
+    ("src.engine.ai_planner.generate_daily_brief", ["brief"], None,
+     Exception("Ollama not running"), ["Error"]),
+    ("src.engine.ai_planner.score_contact_fit", ["score", "1"], None,
+     Exception("AI error"), ["Error"]),
+    ("src.engine.ai_planner.suggest_next_contacts", ["suggest"], None,
+     Exception("AI unavailable"), ["Error"]),
+    ("src.engine.email_composer.draft_first_contact_letter", ["draft", "1"], None,
+     ValueError("Contact not found"), ["Error"]),
+    ("src.engine.email_composer.draft_first_contact_letter", ["draft", "1"], None,
+     RuntimeError("API key missing"), ["API Error", "ANTHROPIC_API_KEY"]),
+    ("src.engine.email_composer.draft_follow_up_letter", ["followup", "1"], "summary\n",
+     ValueError("No interactions found"), ["Error"]),
+    ("src.engine.email_composer.draft_follow_up_letter", ["followup", "1"], "summary\n",
+     RuntimeError("API error"), ["API Error"]),
+]
+
+
+@pytest.mark.parametrize("target, argv, stdin, exc, needles", EXCEPTION_CASES, ids=[
+    "brief", "score", "suggest",
+    "draft_value_error", "draft_runtime_error",
+    "followup_value_error", "followup_runtime_error",
+])
+def test_exception_handled_gracefully(runner, monkeypatch, target, argv, stdin, exc, needles):
+    monkeypatch.setattr(target, MagicMock(side_effect=exc))
+    result = runner.invoke(cli, argv, input=stdin)
+    assert result.exit_code == 0, result.output
+    for needle in needles:
+        assert needle in result.output
 
 
 # ---------------------------------------------------------------------------
@@ -589,137 +614,48 @@ class TestRecon:
         "total_skipped": 2,
     }
 
+    @pytest.fixture(autouse=True)
+    def scout_returns_stats(self, mock_scout):
+        mock_scout.return_value = self.SCOUT_STATS
+
     def test_success(self, runner):
-        with patch("src.engine.lead_scout.scout_city") as mock_scout:
-            mock_scout.return_value = self.SCOUT_STATS
-            result = runner.invoke(cli, ["recon", "Munchen"])
-        assert result.exit_code == 0
+        result = runner.invoke(cli, ["recon", "Munchen"])
+        assert result.exit_code == 0, result.output
         assert "Mission complete" in result.output
         assert "Munchen" in result.output
 
     def test_displays_stats(self, runner):
-        with patch("src.engine.lead_scout.scout_city") as mock_scout:
-            mock_scout.return_value = self.SCOUT_STATS
-            result = runner.invoke(cli, ["recon", "Munchen"])
+        result = runner.invoke(cli, ["recon", "Munchen"])
         assert "10" in result.output  # total_found
         assert "8" in result.output   # total_inserted
         assert "2" in result.output   # total_skipped
 
-    def test_default_types_passed(self, runner):
-        with patch("src.engine.lead_scout.scout_city") as mock_scout:
-            mock_scout.return_value = self.SCOUT_STATS
-            runner.invoke(cli, ["recon", "Munchen"])
+    def test_default_types_passed(self, runner, mock_scout):
+        runner.invoke(cli, ["recon", "Munchen"])
         _, kwargs = mock_scout.call_args
         assert set(kwargs["business_types"]) == {"gallery", "cafe", "coworking"}
 
-    def test_custom_type_passed(self, runner):
-        with patch("src.engine.lead_scout.scout_city") as mock_scout:
-            mock_scout.return_value = self.SCOUT_STATS
-            runner.invoke(cli, ["recon", "Munchen", "--type", "gallery"])
+    def test_custom_type_passed(self, runner, mock_scout):
+        runner.invoke(cli, ["recon", "Munchen", "--type", "gallery"])
         _, kwargs = mock_scout.call_args
         assert kwargs["business_types"] == ["gallery"]
 
     def test_unknown_type_prints_warning(self, runner):
-        with patch("src.engine.lead_scout.scout_city") as mock_scout:
-            mock_scout.return_value = self.SCOUT_STATS
-            result = runner.invoke(cli, ["recon", "Munchen", "--type", "museum"])
+        result = runner.invoke(cli, ["recon", "Munchen", "--type", "museum"])
         assert "Warning" in result.output or "Unknown type" in result.output
 
-    def test_all_sources_disabled_exits_early(self, runner):
-        with patch("src.engine.lead_scout.scout_city") as mock_scout:
-            result = runner.invoke(cli, ["recon", "Munchen", "--no-google", "--no-osm"])
-        assert result.exit_code == 0
+    def test_all_sources_disabled_exits_early(self, runner, mock_scout):
+        result = runner.invoke(cli, ["recon", "Munchen", "--no-google", "--no-osm"])
+        assert result.exit_code == 0, result.output
         assert "All data sources disabled" in result.output
         mock_scout.assert_not_called()
 
-    def test_radius_passed_through(self, runner):
-        with patch("src.engine.lead_scout.scout_city") as mock_scout:
-            mock_scout.return_value = self.SCOUT_STATS
-            runner.invoke(cli, ["recon", "Munchen", "--radius", "5"])
+    def test_radius_passed_through(self, runner, mock_scout):
+        runner.invoke(cli, ["recon", "Munchen", "--radius", "5"])
         _, kwargs = mock_scout.call_args
         assert kwargs["radius_km"] == 5.0
 
-    def test_country_argument(self, runner):
-        with patch("src.engine.lead_scout.scout_city") as mock_scout:
-            mock_scout.return_value = self.SCOUT_STATS
-            runner.invoke(cli, ["recon", "Wien", "AT"])
+    def test_country_argument(self, runner, mock_scout):
+        runner.invoke(cli, ["recon", "Wien", "AT"])
         _, kwargs = mock_scout.call_args
         assert kwargs["country"] == "AT"
-
-
-# ---------------------------------------------------------------------------
-# _prompt_date helper
-# ---------------------------------------------------------------------------
-
-class TestPromptDate:
-
-    def test_valid_date_returned(self):
-        with patch("src.cli.main.click.prompt", return_value="2026-03-15"), \
-             patch("src.cli.main.click.echo"):
-            result = _prompt_date("Date")
-        assert result == date(2026, 3, 15)
-
-    def test_empty_input_returns_none(self):
-        with patch("src.cli.main.click.prompt", return_value=""), \
-             patch("src.cli.main.click.echo"):
-            result = _prompt_date("Date")
-        assert result is None
-
-    def test_invalid_then_valid_retries(self):
-        with patch("src.cli.main.click.prompt", side_effect=["not-a-date", "2026-06-01"]), \
-             patch("src.cli.main.click.echo"):
-            result = _prompt_date("Date")
-        assert result == date(2026, 6, 1)
-
-    def test_default_shown_when_provided(self):
-        default = date(2026, 1, 1)
-        with patch("src.cli.main.click.prompt", return_value=str(default)) as mock_prompt, \
-             patch("src.cli.main.click.echo"):
-            _prompt_date("Date", default=default)
-        _, kwargs = mock_prompt.call_args
-        assert kwargs.get("default") == "2026-01-01"
-
-
-# ---------------------------------------------------------------------------
-# _prompt_email helper
-# ---------------------------------------------------------------------------
-
-class TestPromptEmail:
-
-    def test_valid_email_returned(self):
-        with patch("src.cli.main.click.prompt", return_value="test@example.com"), \
-             patch("src.cli.main.click.echo"):
-            result = _prompt_email()
-        assert result == "test@example.com"
-
-    def test_empty_input_returns_none(self):
-        with patch("src.cli.main.click.prompt", return_value=""), \
-             patch("src.cli.main.click.echo"):
-            result = _prompt_email()
-        assert result is None
-
-    def test_invalid_then_valid_retries(self):
-        with patch("src.cli.main.click.prompt", side_effect=["not-an-email", "valid@example.com"]), \
-             patch("src.cli.main.click.echo"):
-            result = _prompt_email()
-        assert result == "valid@example.com"
-
-    def test_various_valid_formats(self):
-        valid_emails = [
-            "user@domain.com",
-            "user.name+tag@sub.domain.org",
-            "a@b.de",
-        ]
-        for email in valid_emails:
-            with patch("src.cli.main.click.prompt", return_value=email), \
-                 patch("src.cli.main.click.echo"):
-                result = _prompt_email()
-            assert result == email
-
-    def test_invalid_formats_rejected(self):
-        invalid_inputs = ["not-an-email", "missing@tld", "@nodomain.com"]
-        for bad in invalid_inputs:
-            with patch("src.cli.main.click.prompt", side_effect=[bad, "good@example.com"]), \
-                 patch("src.cli.main.click.echo") as mock_echo:
-                _prompt_email()
-            mock_echo.assert_called()  # error message was shown
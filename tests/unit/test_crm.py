@@ -12,11 +12,14 @@ from contextlib import contextmanager
 from datetime import date, datetime
 from unittest.mock import MagicMock, patch, call
 
+from psycopg2 import errors
+
 from src.models import Contact, Interaction, Show
 from src.engine.crm import (
     _validate_columns,
     _CONTACT_COLUMNS,
     _SHOW_COLUMNS,
+    DuplicateContactError,
     create_contact,
     get_contact,
     update_contact,
@@ -133,6 +136,20 @@ def test_create_contact_emits_event():
     mock_emit.assert_called_once_with(EVENT_CONTACT_CREATED, {'contact_id': 7, 'contact': contact})
 
 
+def test_create_contact_duplicate_raises_with_existing_id():
+    cur = make_cursor(fetchone={'id': 3})
+    cur.execute.side_effect = [errors.UniqueViolation('duplicate key'), None]
+    with cursor_patch(cur), patch('src.engine.crm.bus.emit') as mock_emit:
+        with pytest.raises(DuplicateContactError) as exc_info:
+            create_contact(Contact(name='Galerie Stern', city='Augsburg'))
+    assert exc_info.value.contact_id == 3
+    assert 'Galerie Stern' in str(exc_info.value)
+    lookup_sql = cur.execute.call_args[0][0]
+    assert 'lower(btrim(name))' in lookup_sql
+    assert 'deleted_at IS NULL' in lookup_sql
+    mock_emit.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # get_contact
 # ---------------------------------------------------------------------------
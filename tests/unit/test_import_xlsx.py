@@ -4,7 +4,7 @@ Unit tests for scripts/import_xlsx.py.
 Strategy:
   - Pure functions tested directly with varied inputs
   - Database-touching functions tested via dry_run DatabaseConnection (no real DB)
-  - Sheet importers mock pd.read_excel and use dry_run mode
+  - Sheet importers mock read_sheet (or pd.read_excel / the streamed contacts read) and use dry_run mode
   - export_notes_sheets uses tmp_path for file I/O
   - run_import mocks sub-functions and XLSX_PATH to test orchestration flow
 
@@ -15,10 +15,11 @@ Coverage not attempted:
 
 import sys
 import logging
+import logging.handlers
 import numpy as np
 import pandas as pd
 import pytest
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch, call
 
@@ -26,17 +27,31 @@ from unittest.mock import MagicMock, patch, call
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
 
 from import_xlsx import (
+    CONTACT_COLUMNS,
+    NOTES_SHEETS,
     infer_outcome,
+    infer_outcomes,
     make_dedup_key,
+    make_dedup_keys,
     make_unique_name,
+    make_unique_names,
+    venue_choices,
     fuzzy_match_venue,
+    fuzzy_match_venue_prepared,
     DatabaseConnection,
+    load_existing_contact_ids,
     get_or_create_contact,
-    create_interaction,
+    insert_contacts,
+    insert_interactions,
+    update_contact_statuses,
+    read_sheet,
+    read_sheets,
+    stream_sheet,
     import_contacts_leads,
     import_show_dates,
     import_online_platforms,
     export_notes_sheets,
+    run_in_savepoint,
     run_import,
 )
 
@@ -149,6 +164,37 @@ class TestInferOutcome:
     def test_pd_na_returns_no_reply(self):
         assert infer_outcome(pd.NA) == 'no_reply'
 
+    def test_outcome_priority_beats_text_position(self):
+        # 'interested' appears first in the text, but no_reply has priority
+        assert infer_outcome('interested at first, then no reply') == 'no_reply'
+
+
+# ---------------------------------------------------------------------------
+# infer_outcomes (vectorized)
+# ---------------------------------------------------------------------------
+
+class TestInferOutcomes:
+
+    TEXTS = [
+        'she seemed interested in the work',
+        'they declined our request',
+        'a meeting was scheduled for next week',
+        'deal agreed, sold two prints',
+        'INTERESTED in my paintings',
+        'random unrecognised content xyz',
+        'sent info',
+        np.nan,
+        None,
+        pd.Timestamp('2025-01-15'),
+    ]
+
+    def test_matches_scalar_infer_outcome(self):
+        result = infer_outcomes(pd.Series(self.TEXTS, dtype=object))
+        assert list(result) == [infer_outcome(t) for t in self.TEXTS]
+
+    def test_empty_series_returns_empty_array(self):
+        assert len(infer_outcomes(pd.Series([], dtype=object))) == 0
+
 
 # ---------------------------------------------------------------------------
 # make_dedup_key
@@ -157,27 +203,42 @@ class TestInferOutcome:
 class TestMakeDedupKey:
 
     def test_basic(self):
-        assert make_dedup_key('Galerie Stern', 'Augsburg') == 'galerie stern|augsburg'
+        assert make_dedup_key('Galerie Stern', 'Augsburg') == ('galerie stern', 'augsburg')
 
     def test_strips_whitespace(self):
-        assert make_dedup_key('  Galerie  ', '  Augsburg  ') == 'galerie|augsburg'
+        assert make_dedup_key('  Galerie  ', '  Augsburg  ') == ('galerie', 'augsburg')
+
+    def test_keeps_tabs_and_newlines_like_sql_btrim(self):
+        assert make_dedup_key('Galerie\t', 'Augsburg\n') == ('galerie\t', 'augsburg\n')
 
     def test_lowercased(self):
-        assert make_dedup_key('GALERIE STERN', 'AUGSBURG') == 'galerie stern|augsburg'
+        assert make_dedup_key('GALERIE STERN', 'AUGSBURG') == ('galerie stern', 'augsburg')
 
     def test_none_name(self):
-        assert make_dedup_key(None, 'Augsburg') == '|augsburg'
+        assert make_dedup_key(None, 'Augsburg') == ('', 'augsburg')
 
     def test_none_city(self):
-        assert make_dedup_key('Galerie', None) == 'galerie|'
+        assert make_dedup_key('Galerie', None) == ('galerie', '')
 
     def test_both_none(self):
-        assert make_dedup_key(None, None) == '|'
+        assert make_dedup_key(None, None) == ('', '')
 
     def test_deterministic(self):
         assert make_dedup_key('Test', 'City') == make_dedup_key('Test', 'City')
 
 
+class TestMakeDedupKeys:
+
+    def test_matches_scalar_make_dedup_key(self):
+        names = np.array(['Galerie Stern', '  GALERIE\t', 'Cafe X (Berlin)'], dtype=object)
+        cities = pd.Series(['Augsburg', np.nan, ' Berlin '], index=[12, 15, 20], dtype='category')
+        expected = [make_dedup_key(n, c if pd.notna(c) else None) for n, c in zip(names, cities)]
+        assert make_dedup_keys(names, cities) == expected
+
+    def test_empty_columns(self):
+        assert make_dedup_keys([], []) == []
+
+
 # ---------------------------------------------------------------------------
 # make_unique_name
 # ---------------------------------------------------------------------------
@@ -192,15 +253,15 @@ class TestMakeUniqueName:
     def test_first_occurrence_registered_in_dict(self):
         existing = {}
         make_unique_name('Galerie Stern', 'Augsburg', existing)
-        assert 'galerie stern|augsburg' in existing
+        assert ('galerie stern', 'augsburg') in existing
 
     def test_duplicate_appends_city(self):
-        existing = {'galerie stern|augsburg': 1}
+        existing = {('galerie stern', 'augsburg'): 1}
         result = make_unique_name('Galerie Stern', 'Augsburg', existing)
         assert result == 'Galerie Stern (Augsburg)'
 
     def test_duplicate_without_city_unchanged(self):
-        existing = {'galerie stern|': 1}
+        existing = {('galerie stern', ''): 1}
         result = make_unique_name('Galerie Stern', None, existing)
         assert result == 'Galerie Stern'
 
@@ -212,6 +273,23 @@ class TestMakeUniqueName:
         assert r2 == 'Cafe X'
 
 
+class TestMakeUniqueNames:
+
+    def test_matches_scalar_make_unique_name(self):
+        names = pd.Series(['Galerie Stern', 'galerie stern ', 'Cafe X', 'Cafe X', 'Galleries', 'Galleries', 'Cafe X'])
+        cities = pd.Series(['Augsburg', 'Augsburg', 'Berlin', 'Munich', np.nan, np.nan, 'Berlin'], dtype='category')
+        existing = {}
+        expected = [
+            make_unique_name(n, c if pd.notna(c) else None, existing)
+            for n, c in zip(names, cities)
+        ]
+        assert make_unique_names(names, cities).tolist() == expected
+        assert expected[1] == 'galerie stern  (Augsburg)' and expected[6] == 'Cafe X (Berlin)'
+
+    def test_empty_columns(self):
+        assert make_unique_names(pd.Series([], dtype=object), pd.Series([], dtype=object)).tolist() == []
+
+
 # ---------------------------------------------------------------------------
 # fuzzy_match_venue
 # ---------------------------------------------------------------------------
@@ -253,6 +331,11 @@ class TestFuzzyMatchVenue:
         result = fuzzy_match_venue('Galerie', self.CONTACTS, threshold=30)
         assert result is not None
 
+    def test_prepared_choices_match_like_contacts(self):
+        choices = venue_choices(self.CONTACTS)
+        assert choices == {1: 'galerie stern', 2: 'kunsthaus munich', 3: 'cafe boheme'}
+        assert fuzzy_match_venue_prepared('Galerie Sterne', choices, threshold=80) == 1
+
 
 # ---------------------------------------------------------------------------
 # DatabaseConnection — dry_run mode
@@ -301,21 +384,157 @@ class TestGetOrCreateContactDryRun:
 
     def test_returns_none(self):
         with _dry_db() as db:
-            result = get_or_create_contact(db, self.CONTACT_DATA, 'galerie test|augsburg')
+            result = get_or_create_contact(db, self.CONTACT_DATA, ('galerie test', 'augsburg'))
         assert result is None
 
     def test_does_not_call_execute(self):
         with _dry_db() as db:
             with patch.object(db, 'execute') as mock_exec:
-                get_or_create_contact(db, self.CONTACT_DATA, 'galerie test|augsburg')
+                get_or_create_contact(db, self.CONTACT_DATA, ('galerie test', 'augsburg'))
         mock_exec.assert_not_called()
 
 
+class TestGetOrCreateContactLookup:
+
+    def test_existing_contact_found_by_single_upsert(self):
+        db = DatabaseConnection(dry_run=False)
+        db.cursor = MagicMock()
+        db.cursor.fetchone.return_value = {'id': 7, 'inserted': False}
+        data = {'name': '  Galerie TEST ', 'city': 'Augsburg'}
+        assert get_or_create_contact(db, data, ('galerie test', 'augsburg')) == 7
+        db.cursor.execute.assert_called_once()
+        assert 'ON CONFLICT' in db.cursor.execute.call_args[0][0]
+
+    def test_preloaded_hit_skips_query(self):
+        db = DatabaseConnection(dry_run=False)
+        db.cursor = MagicMock()
+        existing_ids = {('galerie test', 'augsburg'): 7}
+        data = {'name': 'Galerie Test', 'city': 'Augsburg'}
+        assert get_or_create_contact(db, data, ('galerie test', 'augsburg'), existing_ids) == 7
+        db.cursor.execute.assert_not_called()
+
+    def test_preloaded_miss_inserts_and_records_id(self):
+        db = DatabaseConnection(dry_run=False)
+        db.cursor = MagicMock()
+        db.cursor.fetchone.return_value = {'id': 12, 'inserted': True}
+        existing_ids = {}
+        data = {'name': 'Galerie Neu', 'city': 'Augsburg'}
+        assert get_or_create_contact(db, data, ('galerie neu', 'augsburg'), existing_ids) == 12
+        assert 'INSERT INTO contacts' in db.cursor.execute.call_args[0][0]
+        assert existing_ids == {('galerie neu', 'augsburg'): 12}
+
+
+class TestLoadExistingContactIds:
+
+    def test_dry_run_returns_empty_dict(self):
+        with _dry_db() as db:
+            assert load_existing_contact_ids(db) == {}
+
+    def test_keys_rows_by_normalized_name_and_city(self):
+        db = DatabaseConnection(dry_run=False)
+        db.cursor = MagicMock()
+        db.cursor.fetchall.return_value = [
+            {'id': 1, 'name_norm': 'galerie stern', 'city_norm': 'augsburg'},
+            {'id': 2, 'name_norm': 'galerie stern', 'city_norm': 'augsburg'},
+            {'id': 3, 'name_norm': 'artsy', 'city_norm': 'online'},
+        ]
+        result = load_existing_contact_ids(db)
+        # Oldest id wins for duplicate keys
+        assert result == {('galerie stern', 'augsburg'): 1, ('artsy', 'online'): 3}
+
+
+# ---------------------------------------------------------------------------
+# insert_contacts
+# ---------------------------------------------------------------------------
+
+class TestInsertContacts:
+
+    @staticmethod
+    def _contact(name, city):
+        return {
+            'name': name, 'type': 'gallery', 'subtype': None, 'city': city,
+            'country': 'DE', 'address': None, 'website': None, 'email': None,
+            'phone': None, 'preferred_language': 'de', 'status': 'cold', 'notes': None,
+        }
+
+    def test_dry_run_returns_none_per_contact(self):
+        with _dry_db() as db:
+            with patch('import_xlsx.execute_values') as mock_values:
+                result = insert_contacts(db, [self._contact('A', 'Augsburg'), self._contact('B', None)])
+        assert result == [None, None]
+        mock_values.assert_not_called()
+
+    def test_empty_batch_skips_query(self):
+        db = DatabaseConnection(dry_run=False)
+        db.cursor = MagicMock()
+        assert insert_contacts(db, []) == []
+        db.cursor.execute.assert_not_called()
+
+    def test_small_batch_uses_one_multi_row_insert(self):
+        db = DatabaseConnection(dry_run=False)
+        db.cursor = MagicMock()
+        contacts = [self._contact('A', 'Augsburg'), self._contact('B', None)]
+        # RETURNING rows may come back in any order
+        returned = [{'ord': 1, 'id': 11, 'inserted': True}, {'ord': 0, 'id': 10, 'inserted': True}]
+        with patch('import_xlsx.execute_values', return_value=returned) as mock_values:
+            assert insert_contacts(db, contacts) == [10, 11]
+        mock_values.assert_called_once()
+        assert mock_values.call_args[1]['fetch'] is True
+        assert [row[0] for row in mock_values.call_args[0][2]] == [0, 1]
+        db.cursor.copy_expert.assert_not_called()
+
+    def test_small_batch_upserts_on_dedup_index(self):
+        db = DatabaseConnection(dry_run=False)
+        db.cursor = MagicMock()
+        with patch('import_xlsx.execute_values', return_value=[]) as mock_values:
+            insert_contacts(db, [self._contact('A', 'Augsburg')])
+        sql = mock_values.call_args[0][1]
+        assert "ON CONFLICT (lower(btrim(name)), lower(btrim(coalesce(city, ''))))" in sql
+        assert 'WHERE deleted_at IS NULL' in sql
+
+    def test_conflict_returns_existing_id_in_input_position(self):
+        # Stored as 'Übersee' / 'AUGSBURG': the conflict row comes back with the
+        # existing spelling, and is still matched to its input by ord
+        db = DatabaseConnection(dry_run=False)
+        db.cursor = MagicMock()
+        contacts = [self._contact('Neu', 'Augsburg'), self._contact('übersee', 'Augsburg')]
+        returned = [{'ord': 1, 'id': 3, 'inserted': False}, {'ord': 0, 'id': 40, 'inserted': True}]
+        with patch('import_xlsx.execute_values', return_value=returned):
+            assert insert_contacts(db, contacts) == [40, 3]
+
+    def test_large_batch_copies_through_temp_table(self):
+        db = DatabaseConnection(dry_run=False)
+        db.cursor = MagicMock()
+        contacts = [self._contact(f'Galerie {i}', 'Augsburg') for i in range(500)]
+        db.cursor.fetchall.return_value = [
+            {'ord': i, 'id': 1000 + i, 'inserted': True} for i in reversed(range(500))
+        ]
+        with patch('import_xlsx.execute_values') as mock_values:
+            result = insert_contacts(db, contacts)
+        assert result == list(range(1000, 1500))
+        mock_values.assert_not_called()
+        sql, buffer = db.cursor.copy_expert.call_args[0]
+        assert sql.startswith('COPY contacts_import (ord, ')
+        assert buffer.getvalue().splitlines()[0] == '0,Galerie 0,gallery,,Augsburg,DE,,,,,de,cold,'
+        upsert_sql = db.cursor.execute.call_args_list[1][0][0]
+        assert 'FROM contacts_import' in upsert_sql
+        assert 'ON CONFLICT' in upsert_sql
+
+    def test_empty_strings_sent_as_null(self):
+        db = DatabaseConnection(dry_run=False)
+        db.cursor = MagicMock()
+        returned = [{'ord': 0, 'id': 10, 'inserted': True}]
+        with patch('import_xlsx.execute_values', return_value=returned) as mock_values:
+            assert insert_contacts(db, [self._contact('A', '')]) == [10]
+        row = mock_values.call_args[0][2][0]
+        assert row[1 + CONTACT_COLUMNS.index('city')] is None
+
+
 # ---------------------------------------------------------------------------
-# create_interaction — dry_run
+# insert_interactions
 # ---------------------------------------------------------------------------
 
-class TestCreateInteractionDryRun:
+class TestInsertInteractions:
 
     INTERACTION_DATA = {
         'contact_id': 1,
@@ -328,11 +547,125 @@ class TestCreateInteractionDryRun:
         'next_action_date': None,
     }
 
-    def test_is_noop(self):
+    def test_dry_run_is_noop(self):
         with _dry_db() as db:
-            with patch.object(db, 'execute') as mock_exec:
-                create_interaction(db, self.INTERACTION_DATA)
-        mock_exec.assert_not_called()
+            with patch('import_xlsx.execute_values') as mock_values:
+                insert_interactions(db, pd.DataFrame([self.INTERACTION_DATA]))
+        mock_values.assert_not_called()
+
+    def test_empty_batch_skips_query(self):
+        db = DatabaseConnection(dry_run=False)
+        db.cursor = MagicMock()
+        with patch('import_xlsx.execute_values') as mock_values:
+            insert_interactions(db, pd.DataFrame(columns=list(self.INTERACTION_DATA)))
+        mock_values.assert_not_called()
+
+    def test_single_batched_insert(self):
+        db = DatabaseConnection(dry_run=False)
+        db.cursor = MagicMock()
+        second = {**self.INTERACTION_DATA, 'contact_id': 2, 'outcome': 'interested'}
+        with patch('import_xlsx.execute_values') as mock_values:
+            insert_interactions(db, pd.DataFrame([self.INTERACTION_DATA, second], dtype=object))
+        mock_values.assert_called_once()
+        sql, rows = mock_values.call_args[0][1:3]
+        assert 'INSERT INTO interactions' in sql
+        assert rows == [
+            (1, date(2026, 1, 15), 'email', 'outbound', 'Sent intro letter to the gallery.', 'no_reply', None, None),
+            (2, date(2026, 1, 15), 'email', 'outbound', 'Sent intro letter to the gallery.', 'interested', None, None),
+        ]
+
+
+# ---------------------------------------------------------------------------
+# update_contact_statuses
+# ---------------------------------------------------------------------------
+
+class TestUpdateContactStatuses:
+
+    def test_dry_run_is_noop(self):
+        with _dry_db() as db:
+            with patch('import_xlsx.execute_values') as mock_values:
+                update_contact_statuses(db, {1: 'contacted'})
+        mock_values.assert_not_called()
+
+    def test_empty_updates_skip_query(self):
+        db = DatabaseConnection(dry_run=False)
+        db.cursor = MagicMock()
+        with patch('import_xlsx.execute_values') as mock_values:
+            update_contact_statuses(db, {})
+        mock_values.assert_not_called()
+
+    def test_single_batched_update(self):
+        db = DatabaseConnection(dry_run=False)
+        db.cursor = MagicMock()
+        with patch('import_xlsx.execute_values') as mock_values:
+            update_contact_statuses(db, {1: 'contacted', 2: 'meeting'})
+        mock_values.assert_called_once()
+        sql, rows = mock_values.call_args[0][1:3]
+        assert 'UPDATE contacts' in sql
+        assert rows == [(1, 'contacted'), (2, 'meeting')]
+
+
+# ---------------------------------------------------------------------------
+# read_sheet / read_sheets
+# ---------------------------------------------------------------------------
+
+class TestReadSheets:
+
+    def test_prefetched_frame_returned_as_is(self):
+        df = _shows_df()
+        with patch('pandas.read_excel') as mock_read:
+            assert read_sheet({'show dates': df}, 'show dates') is df
+        mock_read.assert_not_called()
+
+    def test_notes_sheet_parsed_with_all_columns(self):
+        with patch('pandas.read_excel') as mock_read:
+            read_sheet(MagicMock(), 'plans')
+        assert mock_read.call_args[1]['usecols'] is None
+        assert mock_read.call_args[1]['dtype'] is None
+
+    def test_imported_sheet_read_as_raw_objects(self, tmp_path):
+        path = tmp_path / 'book.xlsx'
+        pd.DataFrame([[None, 'day', 'month', 'year', 'venue'], [None, 5, 3, 2026, 'Galerie']]).to_excel(
+            path, sheet_name='show dates', header=False, index=False)
+        df = read_sheet(path, 'show dates')
+        assert (df.dtypes == object).all()
+        assert df.loc[1].tolist() == [5, 3, 2026, 'Galerie']
+
+    def test_streamed_sheet_keeps_only_used_columns(self, tmp_path):
+        path = tmp_path / 'book.xlsx'
+        row = [f'c{i}' for i in range(23)]
+        pd.DataFrame([row, [None] * 23]).to_excel(path, sheet_name='contacts  leads', header=False, index=False)
+        df = stream_sheet(path, 'contacts  leads')
+        assert list(df.columns) == [3, 4, 5, 6, 7, 13, 14, 15, 16, 17, 18, 19, 20]
+        assert df.iloc[0].tolist() == [f'c{i}' for i in df.columns]
+        assert df.iloc[1].isna().all()
+
+    def test_no_sheets_skips_worker_pool(self):
+        with patch('import_xlsx.ProcessPoolExecutor') as mock_pool:
+            assert read_sheets(Path('unused.xlsx'), []) == {}
+        mock_pool.assert_not_called()
+
+    def test_parses_each_sheet_from_path(self, tmp_path):
+        path = tmp_path / 'book.xlsx'
+        with pd.ExcelWriter(path) as writer:
+            pd.DataFrame([['a', 'b']]).to_excel(writer, sheet_name='plans', header=False, index=False)
+            pd.DataFrame([['c']]).to_excel(writer, sheet_name='ideas', header=False, index=False)
+        sheets = read_sheets(path, ['plans', 'ideas'])
+        assert list(sheets) == ['plans', 'ideas']
+        assert sheets['plans'].values.tolist() == [['a', 'b']]
+        assert sheets['ideas'].values.tolist() == [['c']]
+
+    def test_best_effort_sheet_that_fails_is_left_out(self, tmp_path):
+        path = tmp_path / 'book.xlsx'
+        pd.DataFrame([['a']]).to_excel(path, sheet_name='plans', header=False, index=False)
+        sheets = read_sheets(path, ['plans', 'ideas'], best_effort=['ideas'])
+        assert list(sheets) == ['plans']
+
+    def test_other_sheet_failure_raises(self, tmp_path):
+        path = tmp_path / 'book.xlsx'
+        pd.DataFrame([['a']]).to_excel(path, sheet_name='plans', header=False, index=False)
+        with pytest.raises(ValueError):
+            read_sheets(path, ['plans', 'ideas'])
 
 
 # ---------------------------------------------------------------------------
@@ -343,7 +676,7 @@ class TestImportContactsLeads:
 
     def _run(self, df):
         with _dry_db() as db:
-            with patch('pandas.read_excel', return_value=df):
+            with patch('import_xlsx.read_sheet', return_value=df):
                 return import_contacts_leads(db, MagicMock())
 
     def test_empty_sheet_returns_zeros(self):
@@ -398,10 +731,99 @@ class TestImportContactsLeads:
         created, _, _ = self._run(df)
         assert created == 1
 
+    def _interactions(self, df):
+        with _dry_db() as db:
+            with patch('import_xlsx.read_sheet', return_value=df), \
+                 patch('import_xlsx.insert_interactions') as mock_insert:
+                import_contacts_leads(db, MagicMock())
+        return mock_insert.call_args[0][1].to_dict('records')
+
+    def test_attempt_dates_offset_from_first_contact(self):
+        df = _contacts_df({12: {
+            13: 'Galerie Test', 14: 'Augsburg',
+            3: datetime(2025, 1, 15, 14, 30),
+            5: 'no reply',
+        }})
+        dates = [i['interaction_date'] for i in self._interactions(df)]
+        # first contact cell itself, then the third attempt 10 "months" later
+        assert dates == [date(2025, 1, 15), date(2025, 11, 11)]
+
+    def test_attempt_dates_without_anchor_count_back_from_today(self):
+        df = _contacts_df({12: {13: 'Galerie Test', 14: 'Augsburg', 3: 'yes', 7: 'no reply'}})
+        dates = [i['interaction_date'] for i in self._interactions(df)]
+        today = date.today()
+        assert dates == [today - timedelta(days=600), today]
+
+    def test_blank_attempts_skipped_and_text_stripped(self):
+        df = _contacts_df({12: {13: 'Galerie Test', 14: 'Augsburg', 4: '   ', 5: '  no reply \n'}})
+        summaries = [i['summary'] for i in self._interactions(df)]
+        assert summaries == ['no reply']
+
+    def test_filtered_rows_keep_attempts_aligned(self):
+        df = _contacts_df({
+            12: {13: 'Someone', 14: 'people', 4: 'meeting next week'},
+            13: {13: 'name'},
+            14: {13: 'Galerie Test', 14: 'Augsburg', 4: 'declined'},
+        })
+        interactions = self._interactions(df)
+        assert [(i['summary'], i['outcome']) for i in interactions] == [('declined', 'rejected')]
+
+    def test_repeated_key_creates_one_contact(self):
+        df = _contacts_df({
+            12: {13: 'Galleries', 4: 'no reply'},
+            13: {13: 'Galleries', 5: 'declined'},
+        })
+        with _dry_db() as db:
+            with patch('import_xlsx.read_sheet', return_value=df), \
+                 patch('import_xlsx.insert_contacts', return_value=[None]) as mock_insert, \
+                 patch('import_xlsx.insert_interactions') as mock_interactions:
+                created, _, _ = import_contacts_leads(db, MagicMock())
+        assert created == 2
+        assert [c['name'] for c in mock_insert.call_args[0][1]] == ['Galleries']
+        assert len(mock_interactions.call_args[0][1]) == 2
+
+    def test_interactions_get_ids_from_batch_insert(self):
+        df = _contacts_df({
+            12: {13: 'Galerie Alt', 14: 'Augsburg', 4: 'no reply'},
+            13: {13: 'Galerie Neu', 14: 'Augsburg', 4: 'meeting set'},
+        })
+        db = DatabaseConnection(dry_run=False)
+        db.cursor = MagicMock()
+        with patch('import_xlsx.read_sheet', return_value=df), \
+             patch('import_xlsx.load_existing_contact_ids', return_value={('galerie alt', 'augsburg'): 3}), \
+             patch('import_xlsx.insert_contacts', return_value=[8]) as mock_insert, \
+             patch('import_xlsx.insert_interactions') as mock_interactions, \
+             patch('import_xlsx.update_contact_statuses') as mock_status:
+            import_contacts_leads(db, MagicMock())
+        assert [c['name'] for c in mock_insert.call_args[0][1]] == ['Galerie Neu']
+        assert mock_interactions.call_args[0][1]['contact_id'].tolist() == [3, 8]
+        assert mock_status.call_args[0][1] == {3: 'contacted', 8: 'meeting'}
+
+    def test_status_from_right_most_attempt(self):
+        df = _contacts_df({12: {13: 'Galerie Neu', 14: 'Augsburg', 4: 'meeting set', 6: 'declined'}})
+        db = DatabaseConnection(dry_run=False)
+        db.cursor = MagicMock()
+        with patch('import_xlsx.read_sheet', return_value=df), \
+             patch('import_xlsx.load_existing_contact_ids', return_value={}), \
+             patch('import_xlsx.insert_contacts', return_value=[8]), \
+             patch('import_xlsx.insert_interactions'), \
+             patch('import_xlsx.update_contact_statuses') as mock_status:
+            import_contacts_leads(db, MagicMock())
+        assert mock_status.call_args[0][1] == {8: 'rejected'}
+
     def test_returns_three_tuple(self):
         result = self._run(_contacts_df())
         assert len(result) == 3
 
+    def test_sheet_streamed_instead_of_read_excel(self):
+        with _dry_db() as db:
+            with patch('import_xlsx.STREAMED_SHEETS', {'contacts  leads'}), \
+                 patch('import_xlsx.stream_sheet', return_value=_contacts_df()) as mock_stream, \
+                 patch('pandas.read_excel') as mock_read:
+                import_contacts_leads(db, MagicMock())
+        assert mock_stream.call_args[0][1] == 'contacts  leads'
+        mock_read.assert_not_called()
+
 
 # ---------------------------------------------------------------------------
 # import_show_dates — dry_run + mocked DataFrame
@@ -433,6 +855,30 @@ class TestImportShowDates:
         df = _shows_df({4: {3: 'Galerie Stern', 2: pd.Timestamp('2026-04-01')}})
         assert self._run(df) == 1
 
+    def test_theme_read_from_column_4(self):
+        df = _shows_df({4: {3: 'Galerie Stern', 4: 'Landscapes'}})
+        db = DatabaseConnection(dry_run=False)
+        db.cursor = MagicMock()
+        db.cursor.fetchall.return_value = []
+        with patch('pandas.read_excel', return_value=df):
+            import_show_dates(db, MagicMock())
+        show_data = db.cursor.execute.call_args[0][1]
+        assert show_data['theme'] == 'Landscapes'
+
+    def test_only_real_dates_become_date_start(self):
+        df = _shows_df({
+            4: {3: 'Galerie A', 2: pd.Timestamp('2026-04-01 18:00')},
+            5: {3: 'Galerie B', 2: 28},
+            6: {3: 'Galerie C', 2: '26 27'},
+        })
+        db = DatabaseConnection(dry_run=False)
+        db.cursor = MagicMock()
+        db.cursor.fetchall.return_value = []
+        with patch('pandas.read_excel', return_value=df):
+            import_show_dates(db, MagicMock())
+        starts = [c[0][1]['date_start'] for c in db.cursor.execute.call_args_list[1:]]
+        assert starts == [date(2026, 4, 1), None, None]
+
     def test_multiple_shows_counted(self):
         df = _shows_df({
             4: {3: 'Galerie A', 1: 'March'},
@@ -440,6 +886,15 @@ class TestImportShowDates:
         })
         assert self._run(df) == 2
 
+    def test_contact_names_normalized_once(self):
+        df = _shows_df({
+            4: {3: 'Galerie A', 1: 'March'},
+            5: {3: 'Galerie B', 1: 'May'},
+        })
+        with patch('import_xlsx.venue_choices', return_value={}) as mock_choices:
+            assert self._run(df) == 2
+        mock_choices.assert_called_once()
+
 
 # ---------------------------------------------------------------------------
 # import_online_platforms — dry_run + mocked DataFrame
@@ -536,6 +991,16 @@ class TestExportNotesSheets:
             export_notes_sheets(excel_file)
         assert '# plans' in (tmp_path / 'plans.md').read_text()
 
+    def test_empty_cells_skipped_and_empty_rows_dropped(self, tmp_path):
+        df = pd.DataFrame({0: ['Row A', np.nan, 'Row C'], 1: [np.nan, np.nan, 'Val C']})
+        excel_file = MagicMock()
+        excel_file.sheet_names = ['plans']
+        with patch('import_xlsx.NOTES_DIR', tmp_path), \
+             patch('pandas.read_excel', return_value=df):
+            export_notes_sheets(excel_file)
+        body = (tmp_path / 'plans.md').read_text().split('---\n\n')[1]
+        assert body == 'Row A\n\nRow C | Val C\n\n'
+
     def test_read_error_caught_file_not_created(self, tmp_path):
         excel_file = MagicMock()
         excel_file.sheet_names = ['plans']
@@ -560,6 +1025,40 @@ class TestExportNotesSheets:
             assert export_notes_sheets(excel_file) == 0
 
 
+# ---------------------------------------------------------------------------
+# run_in_savepoint
+# ---------------------------------------------------------------------------
+
+class TestRunInSavepoint:
+
+    def _live_db(self):
+        db = DatabaseConnection(dry_run=False)
+        db.cursor = MagicMock()
+        return db
+
+    def _sql(self, db):
+        return [c[0][0] for c in db.cursor.execute.call_args_list]
+
+    def test_dry_run_calls_importer_without_savepoint(self):
+        importer = MagicMock(return_value=3)
+        with _dry_db() as db:
+            with patch.object(db, 'execute') as mock_exec:
+                assert run_in_savepoint(db, 'sp', importer, 'xlsx') == 3
+        importer.assert_called_once_with(db, 'xlsx')
+        mock_exec.assert_not_called()
+
+    def test_success_releases_savepoint(self):
+        db = self._live_db()
+        assert run_in_savepoint(db, 'sp', MagicMock(return_value=5)) == 5
+        assert self._sql(db) == ['SAVEPOINT sp', 'RELEASE SAVEPOINT sp']
+
+    def test_failure_rolls_back_to_savepoint_and_reraises(self):
+        db = self._live_db()
+        with pytest.raises(RuntimeError):
+            run_in_savepoint(db, 'sp', MagicMock(side_effect=RuntimeError('bad sheet')))
+        assert self._sql(db) == ['SAVEPOINT sp', 'ROLLBACK TO SAVEPOINT sp']
+
+
 # ---------------------------------------------------------------------------
 # run_import — orchestration flow
 # ---------------------------------------------------------------------------
@@ -573,6 +1072,7 @@ class TestRunImport:
         mock_xlsx.exists.return_value = xlsx_exists
         mock_excel = MagicMock()
         mock_excel.sheet_names = []
+        mock_excel.__enter__.return_value = mock_excel
 
         patches = [
             patch('import_xlsx.XLSX_PATH', mock_xlsx),
@@ -610,12 +1110,70 @@ class TestRunImport:
             result = run_import(dry_run=True, log_level='WARNING')
         assert result == 0
 
+    def test_log_file_writes_are_buffered(self, tmp_path):
+        patches = self._patch_run(tmp_path)
+        with ExitStack(patches) as mocks:
+            run_import(dry_run=True, log_level='WARNING')
+        handler = mocks[2].call_args[1]['handlers'][0]
+        file_handler = handler.target
+        handler.close()
+        file_handler.close()
+        assert isinstance(handler, logging.handlers.MemoryHandler)
+        assert isinstance(file_handler, logging.FileHandler)
+        assert file_handler.formatter._fmt == '%(asctime)s - %(levelname)s - %(message)s'
+
     def test_returns_1_when_sub_importer_raises(self, tmp_path):
         patches = self._patch_run(tmp_path, contacts_raises=True)
         with ExitStack(patches) as _:
             result = run_import(dry_run=True, log_level='WARNING')
         assert result == 1
 
+    def test_importers_receive_prefetched_sheets(self, tmp_path):
+        sheets = {'contacts  leads': _contacts_df()}
+        patches = self._patch_run(tmp_path)
+        patches.append(patch('import_xlsx.read_sheets', return_value=sheets))
+        with ExitStack(patches) as mocks:
+            run_import(dry_run=True, log_level='WARNING')
+        mock_contacts, mock_notes = mocks[4], mocks[7]
+        assert mock_contacts.call_args[0][1] is sheets
+        mock_notes.assert_called_once_with(sheets)
+
+    def test_all_sheets_read_best_effort_and_workbook_closed(self, tmp_path):
+        patches = self._patch_run(tmp_path)
+        patches.append(patch('import_xlsx.read_sheets', return_value={}))
+        with ExitStack(patches) as mocks:
+            mocks[3].return_value.sheet_names = ['contacts  leads', 'on line', NOTES_SHEETS[0]]
+            run_import(dry_run=True, log_level='WARNING')
+        mock_excel, mock_read = mocks[3].return_value, mocks[-1]
+        sheet_names = mock_read.call_args[0][1]
+        assert sheet_names == ['contacts  leads', 'on line', NOTES_SHEETS[0]]
+        assert mock_read.call_args[1]['best_effort'] == sheet_names
+        mock_excel.__exit__.assert_called_once()
+
+    def test_unreadable_sheet_fails_only_its_importer(self, tmp_path, caplog):
+        # read_sheets left 'on line' out: its importer's read_sheet raises
+        # KeyError, and contacts and shows still import
+        sheets = {'contacts  leads': _contacts_df(), 'show dates': pd.DataFrame()}
+        patches = self._patch_run(tmp_path, contacts_result=(2, 0, 0))
+        patches[-2] = patch('import_xlsx.import_online_platforms', side_effect=import_online_platforms)
+        patches.append(patch('import_xlsx.read_sheets', return_value=sheets))
+        caplog.set_level(logging.INFO, logger='import_xlsx')
+        with ExitStack(patches) as mocks:
+            result = run_import(dry_run=True, log_level='WARNING')
+        mock_contacts, mock_shows = mocks[4], mocks[5]
+        assert result == 1
+        mock_contacts.assert_called_once()
+        mock_shows.assert_called_once()
+        assert "Error importing online platforms: 'on line'" in caplog.text
+        assert 'Contacts created: 2' in caplog.text
+
+    def test_one_connection_shared_by_all_importers(self, tmp_path):
+        patches = self._patch_run(tmp_path)
+        patches.append(patch('import_xlsx.DatabaseConnection', wraps=DatabaseConnection))
+        with ExitStack(patches) as mocks:
+            run_import(dry_run=True, log_level='WARNING')
+        mocks[-1].assert_called_once_with(dry_run=True)
+
 
 # ---------------------------------------------------------------------------
 # ExitStack helper (contextlib.ExitStack equivalent for a list of patchers)
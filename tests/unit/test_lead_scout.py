@@ -4,7 +4,7 @@ Unit tests for the Lead Scout (src/engine/lead_scout.py).
 Mocking strategy:
 - src.engine.lead_scout.GOOGLE_MAPS_AVAILABLE  → bool patch for import guard
 - src.engine.lead_scout.googlemaps             → Google Maps client
-- requests.post                                   → Overpass HTTP
+- requests.post                                   → Overpass HTTP (mock_post fixture)
 - src.engine.lead_scout.call_ai                → AI calls (all models)
 - src.engine.lead_scout.crm.*                  → all DB-touching crm calls
 - src.engine.lead_scout.SCOUT_DIR              → tmp_path
@@ -18,6 +18,7 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch, call
 
 from src.models import Contact
+from src.engine.crm import DuplicateContactError
 from src.engine.lead_scout import (
     LeadCandidate,
     search_google_maps,
@@ -79,10 +80,19 @@ OSM_RESPONSE_WAY = {
 
 
 def mock_osm_response(data: dict):
-    resp = MagicMock()
-    resp.json.return_value = data
-    resp.raise_for_status.return_value = None
-    return resp
+    return MagicMock(**{'json.return_value': data, 'raise_for_status.return_value': None})
+
+
+# Shared by every test that only inspects the request; nothing asserts on its calls
+EMPTY_OSM_RESPONSE = mock_osm_response({'elements': []})
+
+
+@pytest.fixture
+def mock_post(monkeypatch):
+    """requests.post for the Overpass tests; answers EMPTY_OSM_RESPONSE unless a test sets another."""
+    post = MagicMock(return_value=EMPTY_OSM_RESPONSE)
+    monkeypatch.setattr('requests.post', post)
+    return post
 
 
 # ---------------------------------------------------------------------------
@@ -188,9 +198,9 @@ def test_search_google_maps_returns_empty_on_exception():
 # search_openstreetmap
 # ---------------------------------------------------------------------------
 
-def test_search_osm_returns_candidates_from_nodes():
-    with patch('requests.post', return_value=mock_osm_response(OSM_RESPONSE_NODE)):
-        result = search_openstreetmap('Augsburg', 'DE', 'gallery')
+def test_search_osm_returns_candidates_from_nodes(mock_post):
+    mock_post.return_value = mock_osm_response(OSM_RESPONSE_NODE)
+    result = search_openstreetmap('Augsburg', 'DE', 'gallery')
 
     assert len(result) == 1
     assert result[0].name == 'Galerie am See'
@@ -200,58 +210,54 @@ def test_search_osm_returns_candidates_from_nodes():
     assert result[0].longitude == 10.8978
 
 
-def test_search_osm_extracts_contact_details():
-    with patch('requests.post', return_value=mock_osm_response(OSM_RESPONSE_NODE)):
-        result = search_openstreetmap('Augsburg', 'DE', 'gallery')
+def test_search_osm_extracts_contact_details(mock_post):
+    mock_post.return_value = mock_osm_response(OSM_RESPONSE_NODE)
+    result = search_openstreetmap('Augsburg', 'DE', 'gallery')
 
     assert result[0].website == 'https://galerie-see.de'
     assert result[0].email == 'info@galerie-see.de'
     assert result[0].phone == '+49 821 123456'
 
 
-def test_search_osm_builds_address_from_street_and_number():
-    with patch('requests.post', return_value=mock_osm_response(OSM_RESPONSE_NODE)):
-        result = search_openstreetmap('Augsburg', 'DE', 'gallery')
+def test_search_osm_builds_address_from_street_and_number(mock_post):
+    mock_post.return_value = mock_osm_response(OSM_RESPONSE_NODE)
+    result = search_openstreetmap('Augsburg', 'DE', 'gallery')
 
     assert result[0].address == 'Seestraße 12'
 
 
-def test_search_osm_uses_center_coords_for_way_elements():
-    with patch('requests.post', return_value=mock_osm_response(OSM_RESPONSE_WAY)):
-        result = search_openstreetmap('Augsburg', 'DE', 'cafe')
+def test_search_osm_uses_center_coords_for_way_elements(mock_post):
+    mock_post.return_value = mock_osm_response(OSM_RESPONSE_WAY)
+    result = search_openstreetmap('Augsburg', 'DE', 'cafe')
 
     assert result[0].latitude == 48.370
     assert result[0].longitude == 10.897
 
 
-def test_search_osm_returns_empty_on_request_error():
-    mock_resp = MagicMock()
-    mock_resp.raise_for_status.side_effect = Exception('timeout')
-    with patch('requests.post', return_value=mock_resp):
-        result = search_openstreetmap('Augsburg', 'DE', 'gallery')
+def test_search_osm_returns_empty_on_request_error(mock_post):
+    mock_post.return_value = MagicMock(**{'raise_for_status.side_effect': Exception('timeout')})
+    result = search_openstreetmap('Augsburg', 'DE', 'gallery')
 
     assert result == []
 
 
-def test_search_osm_posts_to_overpass_url():
-    with patch('requests.post', return_value=mock_osm_response({'elements': []})) as mock_post:
-        search_openstreetmap('Augsburg', 'DE', 'gallery')
+def test_search_osm_posts_to_overpass_url(mock_post):
+    search_openstreetmap('Augsburg', 'DE', 'gallery')
 
     url = mock_post.call_args[0][0]
     assert 'overpass-api.de' in url
 
 
-def test_search_osm_uses_verify_true():
-    with patch('requests.post', return_value=mock_osm_response({'elements': []})) as mock_post:
-        search_openstreetmap('Augsburg', 'DE', 'gallery')
+def test_search_osm_uses_verify_true(mock_post):
+    search_openstreetmap('Augsburg', 'DE', 'gallery')
 
     assert mock_post.call_args[1].get('verify') is True
 
 
-def test_search_osm_unnamed_fallback():
+def test_search_osm_unnamed_fallback(mock_post):
     data = {'elements': [{'type': 'node', 'lat': 0, 'lon': 0, 'tags': {}}]}
-    with patch('requests.post', return_value=mock_osm_response(data)):
-        result = search_openstreetmap('Augsburg', 'DE', 'gallery')
+    mock_post.return_value = mock_osm_response(data)
+    result = search_openstreetmap('Augsburg', 'DE', 'gallery')
 
     assert 'Unnamed' in result[0].name
 
@@ -348,6 +354,31 @@ def test_check_duplicate_returns_none_on_partial_match_only():
     assert result is None
 
 
+def test_check_duplicate_ignores_surrounding_spaces():
+    candidate = LeadCandidate(name='  Galerie am Stadtpark ', city='Augsburg  ', type='gallery')
+    with patch('src.engine.lead_scout.crm.search_contacts', return_value=[SAMPLE_CONTACT]) as mock_search:
+        result = check_duplicate(candidate)
+    assert result == SAMPLE_CONTACT
+    assert mock_search.call_args[1]['name'] == 'galerie am stadtpark'
+
+
+def test_check_duplicate_requires_same_city():
+    other_city = Contact(id=2, name='Galerie am Stadtpark', city='Neu-Augsburg',
+                         status='cold', preferred_language='de')
+    with patch('src.engine.lead_scout.crm.search_contacts', return_value=[other_city]):
+        result = check_duplicate(SAMPLE_CANDIDATE)
+    assert result is None
+
+
+def test_check_duplicate_matches_missing_city_to_missing_city():
+    candidate = LeadCandidate(name='Galerie am Stadtpark', city=None, type='gallery')
+    no_city = Contact(id=2, name='Galerie am Stadtpark', city=None,
+                      status='cold', preferred_language='de')
+    with patch('src.engine.lead_scout.crm.search_contacts', return_value=[SAMPLE_CONTACT, no_city]):
+        result = check_duplicate(candidate)
+    assert result == no_city
+
+
 # ---------------------------------------------------------------------------
 # insert_lead
 # ---------------------------------------------------------------------------
@@ -420,6 +451,22 @@ def test_insert_lead_new_contact_notes_include_source():
     assert 'openstreetmap' in contact.notes
 
 
+def test_insert_lead_skips_when_insert_hits_dedup_index():
+    duplicate = DuplicateContactError(Contact(name='Galerie Stern'), 1)
+    with patch('src.engine.lead_scout.check_duplicate', return_value=None), \
+         patch('src.engine.lead_scout.crm.create_contact', side_effect=duplicate):
+        result = insert_lead(SAMPLE_CANDIDATE, skip_if_exists=True)
+    assert result is None
+
+
+def test_insert_lead_returns_existing_id_when_insert_hits_dedup_index():
+    duplicate = DuplicateContactError(Contact(name='Galerie Stern'), 1)
+    with patch('src.engine.lead_scout.check_duplicate', return_value=None), \
+         patch('src.engine.lead_scout.crm.create_contact', side_effect=duplicate):
+        result = insert_lead(SAMPLE_CANDIDATE, skip_if_exists=False)
+    assert result == 1
+
+
 # ---------------------------------------------------------------------------
 # scout_city
 # ---------------------------------------------------------------------------
@@ -11,6 +11,7 @@ from datetime import date, datetime
 from unittest.mock import patch, MagicMock
 
 from src.models import Contact, Interaction, Show
+from src.engine.crm import DuplicateContactError
 from src.mcp.serializers import (
     serialize_contact, serialize_interaction, serialize_show, serialize_list,
 )
@@ -362,3 +363,10 @@ class TestErrorHandling:
         mock_create.side_effect = Exception("insert failed")
         result = json.loads(contact_create(name='Test'))
         assert 'error' in result
+
+    @patch('src.mcp.server.crm.create_contact')
+    def test_create_duplicate_returns_existing_id(self, mock_create):
+        mock_create.side_effect = DuplicateContactError(Contact(name='Test'), 7)
+        result = json.loads(contact_create(name='Test'))
+        assert 'already exists' in result['error']
+        assert result['existing_contact_id'] == 7
@@ -0,0 +1,87 @@
+"""
+Unit tests for the interactive prompt helpers in src/cli/main.py
+(_prompt_date, _prompt_email).
+
+The helpers are plain functions, so they are called directly rather than
+through CliRunner. mock_click / mock_echo monkeypatch click.prompt /
+click.echo.
+"""
+
+import pytest
+from datetime import date
+from unittest.mock import MagicMock
+
+from src.cli.main import _prompt_date, _prompt_email
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def mock_echo(monkeypatch):
+    echo = MagicMock()
+    monkeypatch.setattr("src.cli.main.click.echo", echo)
+    return echo
+
+
+@pytest.fixture
+def mock_click(monkeypatch, mock_echo):
+    """Silences click.echo (mock_echo) and returns the mocked click.prompt."""
+    prompt = MagicMock()
+    monkeypatch.setattr("src.cli.main.click.prompt", prompt)
+    return prompt
+
+
+# ---------------------------------------------------------------------------
+# _prompt_date helper
+# ---------------------------------------------------------------------------
+
+class TestPromptDate:
+
+    @pytest.mark.parametrize("inputs, expected", [
+        (["2026-03-15"], date(2026, 3, 15)),
+        ([""], None),
+        (["not-a-date", "2026-06-01"], date(2026, 6, 1)),
+    ], ids=["valid", "empty_returns_none", "invalid_then_valid_retries"])
+    def test_prompt_date(self, mock_click, inputs, expected):
+        mock_click.side_effect = inputs
+        assert _prompt_date("Date") == expected
+
+    def test_default_shown_when_provided(self, mock_click):
+        default = date(2026, 1, 1)
+        mock_click.return_value = str(default)
+        _prompt_date("Date", default=default)
+        _, kwargs = mock_click.call_args
+        assert kwargs.get("default") == "2026-01-01"
+
+
+# ---------------------------------------------------------------------------
+# _prompt_email helper
+# ---------------------------------------------------------------------------
+
+class TestPromptEmail:
+
+    @pytest.mark.parametrize("inputs, expected", [
+        (["test@example.com"], "test@example.com"),
+        ([""], None),
+        (["not-an-email", "valid@example.com"], "valid@example.com"),
+    ], ids=["valid", "empty_returns_none", "invalid_then_valid_retries"])
+    def test_prompt_email(self, mock_click, inputs, expected):
+        mock_click.side_effect = inputs
+        assert _prompt_email() == expected
+
+    @pytest.mark.parametrize("email", [
+        "user@domain.com",
+        "user.name+tag@sub.domain.org",
+        "a@b.de",
+    ])
+    def test_various_valid_formats(self, mock_click, email):
+        mock_click.return_value = email
+        assert _prompt_email() == email
+
+    @pytest.mark.parametrize("bad", ["not-an-email", "missing@tld", "@nodomain.com"])
+    def test_invalid_formats_rejected(self, mock_click, mock_echo, bad):
+        mock_click.side_effect = [bad, "good@example.com"]
+        _prompt_email()
+        mock_echo.assert_called()  # error message was shown